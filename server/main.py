@@ -1,20 +1,33 @@
 # ruff: noqa: I001, E402
 
-from src.core.bootstrap import bootstrap
+if __name__ == "__main__":
+    # Supervisor process only: uvicorn's reloader / worker processes import
+    # `main:app` themselves, so bootstrapping and building the app here as
+    # well would just do all of it twice.
+    import sys
 
-IS_DEV, NUM_OF_WORKERS = bootstrap()
+    import uvicorn
 
-from src.core.app_factory import create_app
+    from src.core.bootstrap import load_runtime_config
 
-app = create_app()
+    IS_DEV, NUM_OF_WORKERS = load_runtime_config()
 
-# if __name__ == "__main__":
-#     uvicorn.run(
-#         "main:app",
-#         host="0.0.0.0",
-#         port=8000,
-#         # reload=IS_DEV,
-#         reload=False,
-#         log_config=None,
-#         workers=1 if IS_DEV else NUM_OF_WORKERS,
-#     )
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=IS_DEV,
+        log_config=None,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=1 if IS_DEV else NUM_OF_WORKERS,
+    )
+else:
+    from src.core.bootstrap import bootstrap, quiet_heavy_imports
+
+    IS_DEV, NUM_OF_WORKERS = bootstrap()
+
+    with quiet_heavy_imports():
+        from src.core.app_factory import create_app
+
+    app = create_app()
@@ -1,13 +1,15 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from src.core.lifespan import lifespan
 from src.core.settings import CONSTANTS
 from src.middlewares.cors import CORS_POLICY
 from src.middlewares.exception_handler import register_exception_handlers
+from src.middlewares.health import HealthFastPathMiddleware
 from src.middlewares.performance import register_process_time_header
-from src.routes import debug, register_routes
-from src.routes.websocket import ws_router
+from src.routes import register_routes
+from src.schemas.api.response import ORJSONResponse
 
 
 def create_app() -> FastAPI:
@@ -16,16 +18,19 @@ def create_app() -> FastAPI:
         description="AI-powered music emotion detection and instrument classification",
         version=CONSTANTS.APP_VERSION,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
-    register_exception_handlers(app)
-    app.add_middleware(CORSMiddleware, **CORS_POLICY)
-    register_process_time_header(app)
-
     register_routes(app)
-    app.include_router(ws_router.router)
 
-    if CONSTANTS.ENV == "dev":
-        app.include_router(debug.router)
+    register_exception_handlers(app)
+    register_process_time_header(app)
+    app.add_middleware(
+        HealthFastPathMiddleware, path=app.url_path_for("health_check")
+    )
+    app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+    # Added last so it is outermost: preflights are answered before any
+    # other middleware runs
+    app.add_middleware(CORSMiddleware, **CORS_POLICY)
 
     return app
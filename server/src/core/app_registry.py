@@ -1,45 +1,44 @@
+"""
+Process-wide registry for the FastAPI app instance.
+Allows global access to app.state from anywhere in the codebase.
+
+The app is written exactly once (inside lifespan, before any request is
+served) and read on every request, so it lives in a plain module-level slot:
+no lock, no classmethod dispatch.
+"""
+
 from __future__ import annotations
 
-import threading
 from typing import Any, Optional
 
 from fastapi import FastAPI
 
+_app: Optional[FastAPI] = None
+
+
+def register(app: FastAPI) -> None:
+    global _app
+    if _app is not None:
+        raise RuntimeError("App already registered")
+    _app = app
+
+
+def get_app() -> FastAPI:
+    if _app is None:
+        raise RuntimeError(
+            "⚠️ App not registered yet. "
+            "Call `app_registry.register(app)` inside lifespan before use."
+        )
+    return _app
+
+
+def get_state(key: str, default: Any = None) -> Any:
+    """Safely retrieve a key from app.state (returns default if not found)."""
+    # State keeps its attributes in `_state`; a dict lookup avoids the
+    # __getattr__ → AttributeError round-trip that getattr(..., default) pays
+    return get_app().state._state.get(key, default)
+
 
-class AppRegistry:
-    """
-    Thread-safe singleton registry for FastAPI app instance.
-    Allows global access to app.state from anywhere in the codebase.
-    """
-
-    _app: Optional[FastAPI] = None
-    _lock = threading.Lock()
-
-    @classmethod
-    def register(cls, app: FastAPI):
-        with cls._lock:
-            if cls._app is not None:
-                raise RuntimeError("App already registered")
-            cls._app = app
-
-    @classmethod
-    def get(cls) -> FastAPI:
-        with cls._lock:
-            if cls._app is None:
-                raise RuntimeError(
-                    "⚠️ App not registered yet. "
-                    "Call `AppRegistry.register(app)` inside lifespan before use."
-                )
-            return cls._app
-
-    @classmethod
-    def get_state(cls, key: str, default: Any = None) -> Any:
-        """Safely retrieve a key from app.state (returns default if not found)."""
-        app = cls.get_app()
-        return getattr(app.state, key, default)
-
-    @classmethod
-    def set_state(cls, key: str, value: Any):
-        """Set a key-value pair into app.state dynamically."""
-        app = cls.get_app()
-        setattr(app.state, key, value)
+def set_state(key: str, value: Any) -> None:
+    """Set a key-value pair into app.state dynamically."""
+    setattr(get_app().state, key, value)
@@ -1,3 +1,8 @@
+# NOTE: disabled. If this comes back, build and start the scheduler inside
+# lifespan (after storage connects) and shut it down there too — never at
+# module import, where it runs once per worker before a loop exists. The job
+# should open its own session via get_session_factory() at run time.
+
 # from __future__ import annotations
 
 # import logging
@@ -2,41 +2,65 @@ import asyncio
 import os
 import sys
 import warnings
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Literal
 
 from dotenv import load_dotenv
 
 
+def load_runtime_config() -> tuple[bool, int]:
+    """Loads .env and returns (IS_DEV, NUM_OF_WORKERS); installs no hooks or policies."""
+    BASE_DIR = Path(__file__).resolve().parent.parent.parent
+    ENV_PATH = BASE_DIR / ".env"
+
+    load_dotenv(ENV_PATH)
+
+    ENV: Literal["dev", "prod"] = os.getenv("ENV", "dev").lower()
+    IS_DEV: bool = ENV == "dev"
+
+    NUM_OF_WORKERS: int = max(1, os.cpu_count() or 1)
+    return (IS_DEV, NUM_OF_WORKERS)
+
+
 def bootstrap() -> tuple[bool, int]:
     if sys.platform == "win32":
         asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    else:
+        import uvloop
 
-    warnings.filterwarnings("ignore", category=FutureWarning)
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
-    os.environ["TF_ENABLE_ONEDNN_OPTS"] = "0"
     sys.dont_write_bytecode = True
 
-    ENV: Literal["dev", "prod"] = os.getenv("ENV", "dev").lower()
-    IS_DEV: bool = ENV == "dev"
-
-    BASE_DIR = Path(__file__).resolve().parent.parent.parent
-    ENV_PATH = BASE_DIR / ".env"
+    IS_DEV, NUM_OF_WORKERS = load_runtime_config()
 
-    load_dotenv(ENV_PATH)
+    # oneDNN provides TF's vectorised CPU kernels; only opt out explicitly
+    # (set TF_DETERMINISTIC_OPS=1 instead if reproducibility is the concern)
+    if os.getenv("DISABLE_ONEDNN") == "1":
+        os.environ["TF_ENABLE_ONEDNN_OPTS"] = "0"
 
-    from src.core.pretty_errors import setup_error_beautifier
+    if IS_DEV:
+        from src.core.pretty_errors import setup_error_beautifier
 
-    setup_error_beautifier(IS_DEV=IS_DEV, enable=True)
+        setup_error_beautifier(IS_DEV=IS_DEV, enable=True)
 
     import logging
 
     logger = logging.getLogger(__name__)
     logger.info("Logger initialized")
 
-    from src.core.error_hooks import setup_global_error_hooks
+    if IS_DEV:
+        from src.core.error_hooks import setup_global_error_hooks
 
-    setup_global_error_hooks()
+        setup_global_error_hooks()
 
-    NUM_OF_WORKERS: int = max(1, os.cpu_count() or 1)
     return (IS_DEV, NUM_OF_WORKERS)
+
+
+@contextmanager
+def quiet_heavy_imports():
+    """Silences FutureWarnings raised while importing the ML stack (TF / torch / librosa)."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=FutureWarning)
+        yield
@@ -30,16 +30,14 @@ async def _cleanup():
                     AudioFile.scheduled_deletion_at <= datetime.now(timezone.utc)
                 )
             )
-            expired_files = result.scalars().all()
-
-            for audio in expired_files:
-                for bucket in BUCKETS:
-                    try:
-                        await storage.delete_file(bucket, audio.file_path)
-                    except FileNotFoundError:
-                        pass
-                    except Exception as e:
-                        logger.warning(f"Failed deleting {audio.file_path} from {bucket}: {e}")
+            paths = [audio.file_path for audio in result.scalars().all()]
+
+            # one remove() request per bucket instead of one per file
+            for bucket in BUCKETS:
+                try:
+                    await storage.delete_files(bucket, paths)
+                except Exception as e:
+                    logger.warning(f"Failed deleting {len(paths)} files from {bucket}: {e}")
     finally:
         await storage.disconnect()
         await engine.dispose()
@@ -6,27 +6,20 @@ logger = logging.getLogger(__name__)
 _initialized = False
 
 
+def _handle_async_exception(loop, context):
+    exc = context.get("exception")
+    if exc:
+        logger.critical("Unhandled async exception", exc_info=exc)
+    else:
+        logger.critical(f"Unhandled async exception: {context}")
+
+
 def setup_global_error_hooks():
     global _initialized
     if _initialized:
         return
     _initialized = True
 
-    def handle_async_exception(loop, context):
-        exc = context.get("exception")
-        if exc:
-            logger.critical("Unhandled async exception", exc_info=exc)
-        else:
-            logger.critical(f"Unhandled async exception: {context}")
-
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-    loop.set_exception_handler(handle_async_exception)
-
     def handle_unhandled_exception(exc_type, exc_value, exc_traceback):
         if issubclass(exc_type, KeyboardInterrupt):
             sys.__excepthook__(exc_type, exc_value, exc_traceback)
@@ -37,3 +30,11 @@ def setup_global_error_hooks():
         )
 
     sys.excepthook = handle_unhandled_exception
+
+
+def setup_async_error_hook():
+    """
+    Attach the exception handler to the loop actually serving the app.
+    Must be called from inside that loop (i.e. lifespan), never at import.
+    """
+    asyncio.get_running_loop().set_exception_handler(_handle_async_exception)
@@ -1,59 +1,89 @@
 import asyncio
 import logging
 
-from supabase import Client, create_client
+import httpx
+from supabase import AsyncClient, AsyncClientOptions, acreate_client
 
-from src.core.app_registry import AppRegistry
+from src.core import app_registry
 from src.core.settings import CONSTANTS
 from src.core.supabase import (
+    new_http_client,
     supabase_storage_client,
 )
 from src.database.session import get_engine, test_db_connection
-from src.models.model_service import ModelService
 
 logger = logging.getLogger(__name__)
 
 
-def create_supabase_client() -> Client:
-    return create_client(CONSTANTS.SUPABASE_URL, CONSTANTS.SUPABASE_KEY.get_secret_value())
+# httpx pools backing the API clients, closed on shutdown
+_http_clients: list[httpx.AsyncClient] = []
 
 
-def get_supabase():
-    app = AppRegistry.get()
+async def _create_client(key: str) -> AsyncClient:
+    http = new_http_client()
+    try:
+        client = await acreate_client(
+            CONSTANTS.SUPABASE_URL,
+            key,
+            options=AsyncClientOptions(httpx_client=http),
+        )
+    except BaseException:
+        await http.aclose()
+        raise
+    _http_clients.append(http)
+    return client
+
+
+async def create_supabase_client() -> AsyncClient:
+    return await _create_client(CONSTANTS.SUPABASE_KEY.get_secret_value())
+
+
+async def create_supabase_admin_client() -> AsyncClient:
+    return await _create_client(CONSTANTS.SUPABASE_SERVICE_KEY.get_secret_value())
+
+
+# Built on first use, not at startup; usable as Depends(get_supabase)
+_supabase: AsyncClient | None = None
+_supabase_admin: AsyncClient | None = None
+_supabase_lock = asyncio.Lock()
 
-    if app.state.supabase is None:
-        app.state.supabase = create_supabase_client()
 
-    return app.state.supabase
+async def get_supabase() -> AsyncClient:
+    global _supabase
 
+    if _supabase is None:
+        async with _supabase_lock:
+            if _supabase is None:
+                _supabase = await create_supabase_client()
 
-def create_supabase_admin_client() -> Client:
-    return create_client(
-        CONSTANTS.SUPABASE_URL,
-        CONSTANTS.SUPABASE_SERVICE_KEY.get_secret_value(),
-    )
+    return _supabase
 
 
-def get_supabase_admin():
-    app = AppRegistry.get()
+async def get_supabase_admin() -> AsyncClient:
+    global _supabase_admin
 
-    if app.state.supabase_service is None:
-        app.state.supabase_service = create_supabase_admin_client()
+    if _supabase_admin is None:
+        async with _supabase_lock:
+            if _supabase_admin is None:
+                _supabase_admin = await create_supabase_admin_client()
 
-    return app.state.supabase_service
+    return _supabase_admin
 
 
-_storage_lock = asyncio.Lock()
+async def close_supabase_clients() -> None:
+    global _supabase, _supabase_admin
+
+    _supabase = _supabase_admin = None
+    while _http_clients:
+        await _http_clients.pop().aclose()
 
 
 async def get_storage():
-    app = AppRegistry.get()
+    app = app_registry.get_app()
 
     if app.state.storage is None:
-        async with _storage_lock:
-            if app.state.storage is None:
-                await supabase_storage_client.connect()
-                app.state.storage = supabase_storage_client
+        await supabase_storage_client.ensure_connected()
+        app.state.storage = supabase_storage_client
 
     return app.state.storage
 
@@ -62,13 +92,16 @@ _model_lock = asyncio.Lock()
 
 
 async def load_emotion_model() -> bool:
-    app = AppRegistry.get()
+    app = app_registry.get_app()
 
     if app.state.emotion_model_loaded is None:
         async with _model_lock:
             if app.state.emotion_model_loaded is None:
+                from src.models.model_service import ModelService
+
                 logger.info("📦 Loading emotion detection model...")
-                ModelService.initialize_emotion_pipeline()
+                # CPU-bound; off the loop so other warmups overlap with it
+                await asyncio.to_thread(ModelService.initialize_emotion_pipeline)
                 app.state.emotion_model_loaded = True
                 logger.info("✅ Emotion model loaded")
 
@@ -78,7 +111,7 @@ _engine_lock = asyncio.Lock()
 
 
 async def get_db_engine():
-    app = AppRegistry.get()
+    app = app_registry.get_app()
 
     if app.state.db_engine is None:
         async with _engine_lock:
@@ -91,47 +124,21 @@ async def get_db_engine():
 
 
 async def _warmup_db():
-    try:
-        await test_db_connection()
-        logger.info("✅ DB warmup complete")
-    except Exception as e:
-        logger.warning(f"DB warmup failed: {e}")
-
-
-async def _warmup_emotion_model():
-    try:
-        await load_emotion_model()
-        logger.info("✅ Emotion model warmed")
-    except Exception as e:
-        logger.warning(f"Model warmup failed: {e}")
+    if not (await test_db_connection())["ok"]:
+        raise ConnectionError("database ping failed")
 
 
-async def _warmup_storage():
-    try:
-        await get_storage()
-        logger.info("✅ Storage warmed")
-    except Exception as e:
-        logger.warning(f"Storage warmup failed: {e}")
-
-
-async def _warmup_supabase():
-    try:
-        get_supabase()
-        logger.info("✅ Supabase warmed")
-    except Exception as e:
-        logger.warning(f"Supabase warmup failed: {e}")
+WARMUP_TASKS = {
+    "db": _warmup_db,
+    "emotion_model": load_emotion_model,
+    "storage": get_storage,
+    "supabase": get_supabase,
+}
 
 
 _bg_warmed = False
 _warmup_lock = asyncio.Lock()
 
-WARMUP_TASKS = {
-    "db": _warmup_db,
-    "emotion_model": _warmup_emotion_model,
-    "storage": _warmup_storage,
-    "supabase": _warmup_supabase,
-}
-
 
 async def background_warmup(config: dict[str, bool] | None = None):
     global _bg_warmed
@@ -147,22 +154,24 @@ async def background_warmup(config: dict[str, bool] | None = None):
 
         logger.info("🔥 Starting background warmup...")
 
-        tasks = []
-
-        for name, task in WARMUP_TASKS.items():
-            if config.get(name, False):
-                logger.info(f"🔥 Warmup enabled: {name}")
-                tasks.append(task())
+        names = [name for name in WARMUP_TASKS if config.get(name, False)]
 
-        if not tasks:
+        if not names:
             logger.info("⚡ No warmup tasks enabled")
             return
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info(f"🔥 Warmup enabled: {', '.join(names)}")
+
+        # One error path for every task instead of a try/except per warmup
+        results = await asyncio.gather(
+            *(WARMUP_TASKS[name]() for name in names), return_exceptions=True
+        )
 
-        for result in results:
+        for name, result in zip(names, results):
             if isinstance(result, Exception):
-                logger.warning(f"Warmup task failed: {result}")
+                logger.warning(f"{name} warmup failed", exc_info=result)
+            else:
+                logger.info(f"✅ {name} warmed")
 
         logger.info("✅ Background warmup complete")
         _bg_warmed = True
@@ -4,9 +4,12 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from src.core.app_registry import AppRegistry
-from src.core.lazy_loads import background_warmup
+from src.core import app_registry
+from src.core.error_hooks import setup_async_error_hook
+from src.core.lazy_loads import background_warmup, close_supabase_clients
+from src.core.settings import CONSTANTS
 from src.core.supabase import supabase_storage_client
+from src.database.session import dispose_health_engine
 
 logger = logging.getLogger(__name__)
 
@@ -21,11 +24,12 @@ async def lifespan(app: FastAPI):
     logger.info("🎵 Musimo API Starting...")
 
     # Register app
-    AppRegistry.register(app)
+    app_registry.register(app)
+
+    if CONSTANTS.ENV == "dev":
+        setup_async_error_hook()
 
     # ── Lazy placeholders (NO heavy initialization here) ──────────────
-    app.state.supabase = None
-    app.state.supabase_service = None
     app.state.storage = None
     app.state.emotion_model_loaded = None
     app.state.db_engine = None
@@ -37,13 +41,17 @@ async def lifespan(app: FastAPI):
         "supabase": True,
     }
 
-    asyncio.create_task(background_warmup(app.state.warmup_config))
+    # Supabase, storage, DB and model warmups run concurrently in here;
+    # keep the handle so the task can't be garbage-collected mid-gather
+    warmup = asyncio.create_task(background_warmup(app.state.warmup_config))
 
     logger.info("⚡ Lazy initialization enabled (fast startup)")
 
     yield  # ← app runs here
 
     # ── Shutdown ─────────────────────────────────────────────────────
+    warmup.cancel()
+
     try:
         if supabase_storage_client.is_connected:
             await supabase_storage_client.disconnect()
@@ -51,10 +59,20 @@ async def lifespan(app: FastAPI):
         pass
 
     try:
-        engine = AppRegistry.get_state("db_engine")
+        await close_supabase_clients()
+    except Exception:
+        pass
+
+    try:
+        engine = app_registry.get_state("db_engine")
         if engine:
             await engine.dispose()
     except Exception:
         pass
 
+    try:
+        await dispose_health_engine()
+    except Exception:
+        pass
+
     logger.info("🎵 Musimo API shut down cleanly.")
@@ -1,39 +1,61 @@
-import json
 import logging
 import os
-import re
 import sys
+import time
 import traceback
 from datetime import UTC, datetime
+from pathlib import Path
 
-import pretty_errors
+import orjson
 
 IS_DEV: bool = os.getenv("ENV", "dev") == "dev"
 
+# Neither formatter prints process/thread/task info; skip collecting it per record
+logging.logProcesses = False
+logging.logThreads = False
+logging.logMultiprocessing = False
+logging.logAsyncioTasks = False
+
 root_logger = logging.getLogger()
 root_logger.setLevel(logging.DEBUG if IS_DEV else logging.INFO)
 
 stream_handler = logging.StreamHandler(sys.stdout)
 
-# Detect your own files only
-PROJECT_TRACEBACK_PATTERN = re.compile(
-    r"[\\/](server[\\/](src|tests))[\\/].+\.py", re.IGNORECASE
+# Detect your own files only — a plain substring test per line, no regex
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+PROJECT_PREFIXES = (
+    str(BASE_DIR / "src") + os.sep,
+    str(BASE_DIR / "tests") + os.sep,
 )
 
 
+def _is_project_line(line: str) -> bool:
+    return PROJECT_PREFIXES[0] in line or PROJECT_PREFIXES[1] in line
+
+
+def _get_tb_lines(record: logging.LogRecord) -> list[str]:
+    """Format the record's traceback once; every formatter/handler reuses it."""
+    lines = record.__dict__.get("_formatted_tb")
+    if lines is None:
+        lines = "".join(traceback.format_exception(*record.exc_info)).splitlines()
+        record._formatted_tb = lines
+    return lines
+
+
 # --- Pretty Traceback Filter -------------------------------------------------
-def filter_pretty_traceback(exc_info):
-    type_, value, tb = exc_info
-    full_tb = "".join(traceback.format_exception(type_, value, tb))
+def filter_pretty_traceback(record: logging.LogRecord):
+    type_, value, tb = record.exc_info
 
+    exc_prefixes = (type_.__name__, str(value))
     filtered = [
         line
-        for line in full_tb.splitlines()
-        if PROJECT_TRACEBACK_PATTERN.search(line)
-        or line.strip().startswith(type_.__name__)
-        or line.strip().startswith(str(value))
+        for line in _get_tb_lines(record)
+        if _is_project_line(line) or line.lstrip().startswith(exc_prefixes)
     ]
     if not filtered:
+        # only the dev formatter gets here; keep pretty_errors out of prod imports
+        import pretty_errors
+
         return "".join(pretty_errors.excepthook(type_, value, tb))
     return "\n".join(filtered)
 
@@ -73,20 +95,47 @@ class DevFormatter(logging.Formatter):
         else:
             return self.SOURCE_COLORS["other"]
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Everything that depends only on level / logger name is built once
+        self._levels = {
+            name: (f"{color}{name:<8}{self.RESET}", color)
+            for name, color in self.COLORS.items()
+        }
+        self._sources: dict[str, str] = {}
+        # HH:MM:SS only changes once a second; reformat it only then
+        self._ts_second = -1
+        self._ts_str = ""
+
+    def _source(self, name: str) -> str:
+        src = self._sources.get(name)
+        if src is None:
+            record_name = "uvicorn" if name.startswith("uvicorn") else name
+            src = f"{self._source_color(record_name)}{record_name}{self.RESET}"
+            self._sources[name] = src
+        return src
+
     def format(self, record):
-        record_name = "uvicorn" if record.name.startswith("uvicorn") else record.name
-        time_str = datetime.now().strftime("%H:%M:%S")
-        level_color = self.COLORS.get(record.levelname, "")
-        src_color = self._source_color(record_name)
-        level = f"{level_color}{record.levelname:<8}{self.RESET}"
-        src = f"{src_color}{record_name}{self.RESET}"
-        msg = f"{level_color}{record.getMessage()}{self.RESET}"
+        levelname = record.levelname
+        level, level_color = self._levels.get(levelname) or (
+            f"{levelname:<8}{self.RESET}",
+            "",
+        )
+        second = int(record.created)
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_str = time.strftime("%H:%M:%S", time.localtime(second))
+        time_str = self._ts_str
 
         # Compose final colored line
-        formatted = f"{self.BOLD}{time_str}{self.RESET} | {level} | {src} | {msg}"
+        formatted = (
+            f"{self.BOLD}{time_str}{self.RESET} | {level} | "
+            f"{self._source(record.name)} | "
+            f"{level_color}{record.getMessage()}{self.RESET}"
+        )
 
         if record.exc_info:
-            formatted += f"\n{filter_pretty_traceback(record.exc_info)}"
+            formatted += f"\n{filter_pretty_traceback(record)}"
 
         return formatted
 
@@ -95,19 +144,17 @@ class DevFormatter(logging.Formatter):
 class JSONFormatter(logging.Formatter):
     def format(self, record):
         log_record = {
-            "timestamp": datetime.now(UTC).isoformat() + "Z",
+            # orjson renders the aware datetime natively (…Z via OPT_UTC_Z)
+            "timestamp": datetime.fromtimestamp(record.created, UTC),
             "level": record.levelname,
             "logger": "uvicorn" if record.name.startswith("uvicorn") else record.name,
             "message": record.getMessage(),
         }
         if record.exc_info:
-            tb = "".join(traceback.format_exception(*record.exc_info))
             log_record["traceback"] = [
-                line
-                for line in tb.splitlines()
-                if PROJECT_TRACEBACK_PATTERN.search(line)
+                line for line in _get_tb_lines(record) if _is_project_line(line)
             ]
-        return json.dumps(log_record)
+        return orjson.dumps(log_record, option=orjson.OPT_UTC_Z).decode()
 
 
 # --- Handler assignment ------------------------------------------------------
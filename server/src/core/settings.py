@@ -1,7 +1,5 @@
-from dotenv import load_dotenv
-load_dotenv()
-
 from functools import cached_property, lru_cache
+from pathlib import Path
 from typing import List, Literal
 
 from pydantic import Field, ValidationError, SecretStr
@@ -9,6 +7,8 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from .logger_setup import logger
 
+ENV_PATH = Path(__file__).resolve().parent.parent.parent / ".env"
+
 
 class Settings(BaseSettings):
     # APPLICATION
@@ -41,6 +41,13 @@ class Settings(BaseSettings):
     DATABASE_POOLER_HOST: str
     DATABASE_POOLER_USER: str
 
+    # Per-worker pool; keep (size + overflow) * workers under the pooler's
+    # client limit (15 on Supabase's free tier), minus headroom for migrations
+    DB_POOL_SIZE: int = 3
+    DB_MAX_OVERFLOW: int = 2
+    DB_POOL_TIMEOUT: int = 30  # seconds
+    DB_POOL_RECYCLE: int = 1800  # seconds
+
     # @computed_field
     # @property
     @cached_property
@@ -78,6 +85,12 @@ class Settings(BaseSettings):
     UPLOAD_DIR: str = "uploads"
     ALLOWED_AUDIO_EXTENSIONS: str = ".mp3,.wav,.flac,.ogg,.m4a"
 
+    @cached_property
+    def ALLOWED_AUDIO_EXT_SET(self) -> frozenset[str]:
+        return frozenset(
+            ext.strip().lower() for ext in self.ALLOWED_AUDIO_EXTENSIONS.split(",")
+        )
+
     # OTP
     OTP_EXPIRE_MINUTES: int = 10
     OTP_LENGTH: int = 6
@@ -107,7 +120,13 @@ class Settings(BaseSettings):
     # REDIS
     REDIS_URL: str = "redis://localhost:6379/0"
 
-    model_config = SettingsConfigDict(extra="ignore", case_sensitive=True)
+    # HEALTH
+    HEALTH_CACHE_TTL: int = 5  # seconds
+
+    # pydantic-settings reads .env itself; real env vars still take precedence
+    model_config = SettingsConfigDict(
+        env_file=ENV_PATH, extra="ignore", case_sensitive=True
+    )
 
 
 @lru_cache()
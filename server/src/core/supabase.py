@@ -3,48 +3,99 @@
 Async Supabase storage client — singleton pattern.
 
 - One instance is created at module load (`supabase_storage_client`).
-- `lifespan.py` calls `.connect()` / `.disconnect()` at app startup/shutdown.
+- The first `get_storage()` call connects it; `lifespan.py` only calls
+  `.disconnect()` at shutdown.
 - `get_storage()` is the FastAPI dependency that injects the same instance.
 - Always use the singleton — never instantiate SupabaseStorageClient elsewhere.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Optional
 
-from supabase import AsyncClient, acreate_client
+import httpx
+from supabase import AsyncClient, AsyncClientOptions, acreate_client
 
 from src.core.settings import CONSTANTS
 
 logger = logging.getLogger(__name__)
 
+# One pooled HTTP/2 client shared by storage/postgrest, kept warm between calls
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=50, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+_HTTP_TIMEOUT = httpx.Timeout(20.0, connect=5.0)
+
+
+def new_http_client() -> httpx.AsyncClient:
+    """Pooled keep-alive HTTP/2 client to hand to acreate_client()."""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=_HTTP_LIMITS,
+        timeout=_HTTP_TIMEOUT,
+        follow_redirects=True,
+    )
+
 
 class SupabaseStorageClient:
     def __init__(self) -> None:
         self._client: Optional[AsyncClient] = None
+        self._http: Optional[httpx.AsyncClient] = None
+        self._lock = asyncio.Lock()
 
     # ── Lifecycle ─────────────────────────────────────────────────────────────
     async def connect(self) -> None:
-        """Initialise the Supabase async client using service role key (server)."""
-        self._client = await acreate_client(
-            CONSTANTS.SUPABASE_URL, CONSTANTS.SUPABASE_SERVICE_KEY.get_secret_value()
-        )
-        logger.info(
-            "✅ Supabase async storage client initialised with service role key"
-        )
+        """Initialise the Supabase async client using service role key (server).
+
+        Idempotent: a second call while connected is a no-op, so a re-run
+        lifespan never orphans the first client's connection pool.
+        """
+        async with self._lock:
+            if self._client is not None:
+                return
+
+            http = new_http_client()
+            try:
+                self._client = await acreate_client(
+                    CONSTANTS.SUPABASE_URL,
+                    CONSTANTS.SUPABASE_SERVICE_KEY.get_secret_value(),
+                    options=AsyncClientOptions(httpx_client=http),
+                )
+            except BaseException:
+                await http.aclose()
+                raise
+            self._http = http
+            logger.info(
+                "✅ Supabase async storage client initialised with service role key"
+            )
+
+    async def ensure_connected(self) -> None:
+        """Connect on first use; concurrent callers share one handshake."""
+        if self._client is None:
+            await self.connect()
 
     async def disconnect(self) -> None:
-        self._client = None
+        async with self._lock:
+            self._client = None
+            if self._http is not None:
+                # close the pooled sockets rather than leaving them to the GC
+                await self._http.aclose()
+                self._http = None
         logger.info("ℹ️ Supabase async storage client released")
 
+    @property
+    def is_connected(self) -> bool:
+        return self._client is not None
+
     # ── Internal ──────────────────────────────────────────────────────────────
     @property
     def client(self) -> AsyncClient:
         if self._client is None:
             raise RuntimeError(
                 "SupabaseStorageClient not initialised — "
-                "call connect() first or use via FastAPI lifespan"
+                "call connect() first or inject it via get_storage()"
             )
         return self._client
 
@@ -97,6 +148,21 @@ class SupabaseStorageClient:
 
         raise Exception("Invalid response from Supabase download")
 
+    async def delete_files(self, bucket: str, paths: list[str]) -> list[str]:
+        """
+        Delete many files from one bucket in a single request.
+
+        Returns the paths Supabase actually removed; paths that did not exist
+        are simply missing from the result.
+        """
+        if not paths:
+            return []
+        response = await self._storage().from_(bucket).remove(paths)
+        logger.debug(
+            "Storage delete response bucket=%s paths=%s → %s", bucket, paths, response
+        )
+        return [obj["name"] for obj in response or ()]
+
     async def delete_file(self, bucket: str, path: str) -> None:
         """
         Delete a file from Supabase Storage.
@@ -105,12 +171,7 @@ class SupabaseStorageClient:
         raise. We treat an empty response as FileNotFoundError so the caller can
         decide whether to swallow it or surface it.
         """
-        response = await self._storage().from_(bucket).remove([path])
-        logger.debug(
-            "Storage delete response bucket=%s path=%s → %s", bucket, path, response
-        )
-
-        if not response:
+        if not await self.delete_files(bucket, [path]):
             raise FileNotFoundError(
                 f"File not found in storage (bucket={bucket}, path={path})"
             )
@@ -121,6 +182,7 @@ class SupabaseStorageClient:
 supabase_storage_client = SupabaseStorageClient()
 
 
-def get_storage() -> SupabaseStorageClient:
-    """FastAPI dependency — returns the singleton connected during lifespan."""
+async def get_storage() -> SupabaseStorageClient:
+    """FastAPI dependency — returns the singleton, connecting it on first use."""
+    await supabase_storage_client.ensure_connected()
     return supabase_storage_client
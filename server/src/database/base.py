@@ -1,10 +1,12 @@
 # app/db/base.py
 import re
+from collections.abc import Callable
 from datetime import datetime
+from functools import cache
 
-from sqlalchemy import MetaData
-from sqlalchemy.inspection import inspect
-from sqlalchemy.orm import DeclarativeBase, declared_attr
+from sqlalchemy import DateTime, MetaData
+from sqlalchemy.orm import DeclarativeBase, class_mapper
+from sqlalchemy.orm.base import instance_state
 
 # optional naming convention (helps with Alembic migrations)
 metadata = MetaData(
@@ -18,41 +20,82 @@ metadata = MetaData(
 )
 
 
+_CAMEL_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+@cache
 def camel_to_snake(name: str) -> str:
-    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+    if name.islower():
+        return name
+    return _CAMEL_RE.sub("_", name).lower()
+
+
+_MISSING = object()
+
+
+@cache
+def _to_dict_plan(
+    cls: type,
+) -> tuple[tuple[tuple[str, Callable | None], ...], tuple[str, ...]]:
+    """
+    Class-invariant serialization plan: ((column key, encoder), ...) plus the
+    relationship keys. Encoders are resolved from column types once, so the
+    per-row loop never type-checks values.
+    """
+    mapper = class_mapper(cls)
+    relationships = tuple(mapper.relationships.keys())
+    columns = tuple(
+        (
+            attr.key,
+            datetime.isoformat
+            if isinstance(attr.columns[0].type, DateTime)
+            else None,
+        )
+        for attr in mapper.column_attrs
+        if not attr.key.startswith("_")
+    )
+    return columns, relationships
+
+
+@cache
+def _repr_keys(cls: type) -> tuple[str, ...]:
+    return tuple(attr.key for attr in class_mapper(cls).column_attrs)
 
 
 class Base(DeclarativeBase):
     metadata = metadata
 
-    @declared_attr.directive
-    def __tablename__(cls) -> str:
-        return camel_to_snake(cls.__name__) + "s"
+    def __init_subclass__(cls, **kwargs):
+        # Plain class attribute, set before declarative scans the class
+        if "__tablename__" not in cls.__dict__ and not cls.__dict__.get(
+            "__abstract__"
+        ):
+            cls.__tablename__ = camel_to_snake(cls.__name__) + "s"
+        super().__init_subclass__(**kwargs)
 
     def to_dict(self, include_relationships: bool = False) -> dict:
         """
         Safe for async contexts — only includes already-loaded attributes.
         """
-        mapper = inspect(self)
+        columns, relationships = _to_dict_plan(type(self))
+        # Loaded attributes live in the state dict; unloaded/expired ones are
+        # simply absent, so no `unloaded` set has to be built
+        values = instance_state(self).dict
         data = {}
 
-        for attr in mapper.attrs:
-            if not attr.key.startswith("_"):
-                if attr.key in mapper.unloaded:
-                    continue
-                value = getattr(self, attr.key, None)
-
-                # Handle datetime serialization
-                if isinstance(value, datetime):
-                    value = value.isoformat()
-
-                data[attr.key] = value or None
+        for key, encode in columns:
+            value = values.get(key, _MISSING)
+            if value is _MISSING:
+                continue
+            if encode is not None and value is not None:
+                value = encode(value)
+            data[key] = value
 
         if include_relationships:
-            for name, rel in mapper.relationships.items():
-                if name in mapper.unloaded:
+            for name in relationships:
+                value = values.get(name, _MISSING)
+                if value is _MISSING:
                     continue
-                value = getattr(self, name)
                 if value is None:
                     data[name] = None
                 elif isinstance(value, list):
@@ -63,6 +106,9 @@ class Base(DeclarativeBase):
         return data
 
     def __repr__(self):
-        """Readable repr for debugging."""
-        cols = {c.key: getattr(self, c.key) for c in inspect(self).mapper.column_attrs}
-        return f"<{self.__class__.__name__} {cols}>"
+        """Readable repr for debugging; never triggers a load of unloaded columns."""
+        values = instance_state(self).dict
+        pairs = ", ".join(
+            f"{key}={values[key]!r}" for key in _repr_keys(type(self)) if key in values
+        )
+        return f"<{type(self).__name__} {pairs}>"
@@ -1,26 +1,26 @@
 import enum
 
 
-class AudioSourceType(enum.Enum):
+class AudioSourceType(str, enum.Enum):
     ORIGINAL = "original"
     SEPARATED = "separated"
 
 
-class SeparatedSourceLabel(enum.Enum):
+class SeparatedSourceLabel(str, enum.Enum):
     VOCALS = "vocals"
     DRUMS = "drums"
     BASS = "bass"
     OTHER = "other"
 
 
-class AnalysisType(enum.Enum):
+class AnalysisType(str, enum.Enum):
     EMOTION = "emotion"
     INSTRUMENT = "instrument"
     FEATURES = "features"
     SEPARATION = "separation"
 
 
-class AudioFormat(enum.Enum):
+class AudioFormat(str, enum.Enum):
     WAV = "wav"
     MP3 = "mp3"
     FLAC = "flac"
@@ -28,7 +28,7 @@ class AudioFormat(enum.Enum):
     OGG = "ogg"
 
 
-class AudioFileStatus(enum.Enum):
+class AudioFileStatus(str, enum.Enum):
     UPLOADED = "uploaded"
     PROCESSING = "processing"
     PROCESSED = "processed"
@@ -36,7 +36,7 @@ class AudioFileStatus(enum.Enum):
     PENDING_DELETION = "pending_deletion"
 
 
-class FeatureType(enum.Enum):
+class FeatureType(str, enum.Enum):
     LOW_LEVEL = "low_level"
     MID_LEVEL = "mid_level"
     HIGH_LEVEL = "high_level"
@@ -44,32 +44,32 @@ class FeatureType(enum.Enum):
     MEL_SPECTROGRAM = "mel_spectrogram"
 
 
-class JobStatus(enum.Enum):
+class JobStatus(str, enum.Enum):
     QUEUED = "queued"
     PROCESSING = "processing"
     COMPLETED = "completed"
     FAILED = "failed"
 
 
-class OtpType(enum.Enum):
+class OtpType(str, enum.Enum):
     EMAIL_VERIFICATION = "email_verification"
     PASSWORD_RESET = "password_reset"
     TWO_FACTOR_AUTH = "two_factor_auth"
 
 
-class LogLevel(enum.Enum):
+class LogLevel(str, enum.Enum):
     info = "info"
     warning = "warning"
     error = "error"
     debug = "debug"
 
 
-class EntityType(enum.Enum):
+class EntityType(str, enum.Enum):
     audio_file = "audio_file"
     analysis_record = "analysis_record"
     project = "project"
 
-class SeparationStatus(enum.Enum):
+class SeparationStatus(str, enum.Enum):
     PENDING = "pending"       # audio uploaded, task not yet enqueued
     PROCESSING = "processing" # celery task running demucs
     COMPLETED = "completed"   # stems stored in supabase
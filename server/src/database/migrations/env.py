@@ -21,6 +21,10 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+# Autogenerate against an empty MetaData would propose dropping every table
+if not target_metadata.tables:
+    raise RuntimeError("No models registered on Base.metadata; import src.database.models")
+
 
 def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
@@ -0,0 +1,32 @@
+"""index analysis_records.model_id
+
+Revision ID: 0b6e4d2a9c15
+Revises: f7a1c3d9e248
+Create Date: 2026-10-16 12:21:07.583190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b6e4d2a9c15'
+down_revision: Union[str, Sequence[str], None] = 'f7a1c3d9e248'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        op.f('ix_analysis_records_model_id'),
+        'analysis_records',
+        ['model_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_analysis_records_model_id'), table_name='analysis_records')
@@ -0,0 +1,82 @@
+"""fold separated_audio_files into audio_files
+
+SeparatedAudioFile moves from joined to single-table inheritance: its
+columns live on audio_files (nullable) and rows are told apart by
+source_type alone, so stem loads no longer join a second table.
+
+Revision ID: 3d9f7a5c2e81
+Revises: 0b6e4d2a9c15
+Create Date: 2026-10-16 12:48:52.917604
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d9f7a5c2e81'
+down_revision: Union[str, Sequence[str], None] = '0b6e4d2a9c15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('audio_files', sa.Column('parent_audio_id', sa.UUID(), nullable=True))
+    op.add_column('audio_files', sa.Column('source_label', sa.String(length=32), nullable=True))
+    op.add_column('audio_files', sa.Column('separation_analysis_id', sa.UUID(), nullable=True))
+
+    op.execute(
+        """
+        UPDATE audio_files AS a
+        SET parent_audio_id = s.parent_audio_id,
+            source_label = s.source_label,
+            separation_analysis_id = s.separation_analysis_id
+        FROM separated_audio_files AS s
+        WHERE a.id = s.id
+        """
+    )
+
+    op.create_index(op.f('ix_audio_files_parent_audio_id'), 'audio_files', ['parent_audio_id'], unique=False)
+    op.create_index(op.f('ix_audio_files_separation_analysis_id'), 'audio_files', ['separation_analysis_id'], unique=False)
+    op.create_foreign_key(op.f('fk_audio_files__parent_audio_id__audio_files'), 'audio_files', 'audio_files', ['parent_audio_id'], ['id'])
+    op.create_foreign_key(op.f('fk_audio_files__separation_analysis_id__separation_anal_306b'), 'audio_files', 'separation_analysis_records', ['separation_analysis_id'], ['id'], ondelete='SET NULL')
+
+    op.drop_table('separated_audio_files')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_table(
+        'separated_audio_files',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('parent_audio_id', sa.UUID(), nullable=False),
+        sa.Column('source_label', sa.String(length=32), nullable=False),
+        sa.Column('separation_analysis_id', sa.UUID(), nullable=True),
+        sa.ForeignKeyConstraint(['id'], ['audio_files.id'], name=op.f('fk_separated_audio_files__id__audio_files'), ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['parent_audio_id'], ['audio_files.id'], name=op.f('fk_separated_audio_files__parent_audio_id__audio_files')),
+        sa.ForeignKeyConstraint(['separation_analysis_id'], ['separation_analysis_records.id'], name=op.f('fk_separated_audio_files__separation_analysis_id__separ_4929'), ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id', name=op.f('pk_separated_audio_files')),
+    )
+    op.create_index(op.f('ix_separated_audio_files_parent_audio_id'), 'separated_audio_files', ['parent_audio_id'], unique=False)
+    op.create_index(op.f('ix_separated_audio_files_separation_analysis_id'), 'separated_audio_files', ['separation_analysis_id'], unique=False)
+
+    op.execute(
+        """
+        INSERT INTO separated_audio_files
+            (id, parent_audio_id, source_label, separation_analysis_id)
+        SELECT id, parent_audio_id, source_label, separation_analysis_id
+        FROM audio_files
+        WHERE source_type = 'SEPARATED'
+        """
+    )
+
+    op.drop_constraint(op.f('fk_audio_files__separation_analysis_id__separation_anal_306b'), 'audio_files', type_='foreignkey')
+    op.drop_constraint(op.f('fk_audio_files__parent_audio_id__audio_files'), 'audio_files', type_='foreignkey')
+    op.drop_index(op.f('ix_audio_files_separation_analysis_id'), table_name='audio_files')
+    op.drop_index(op.f('ix_audio_files_parent_audio_id'), table_name='audio_files')
+    op.drop_column('audio_files', 'separation_analysis_id')
+    op.drop_column('audio_files', 'source_label')
+    op.drop_column('audio_files', 'parent_audio_id')
@@ -0,0 +1,37 @@
+"""replace ix_logs_entity_ref with (entity_type, entity_id, created_at DESC)
+
+Revision ID: 6e1a9d3b7f52
+Revises: 8c2b5e7f4a16
+Create Date: 2026-10-16 13:51:19.736042
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e1a9d3b7f52'
+down_revision: Union[str, Sequence[str], None] = '8c2b5e7f4a16'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_logs_entity_recent',
+        'logs',
+        ['entity_type', 'entity_id', sa.text('created_at DESC')],
+        unique=False,
+    )
+    op.drop_index('ix_logs_entity_ref', table_name='logs', if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        'ix_logs_entity_ref', 'logs', ['entity_type', 'entity_id'], unique=False
+    )
+    op.drop_index('ix_logs_entity_recent', table_name='logs')
@@ -0,0 +1,66 @@
+"""rename audio_features."FeatureAnalysisRecord" to analysis_record_id
+
+AudioFeature.analysis_record_id passed "FeatureAnalysisRecord" as the
+column name, so the foreign key column was created under that quoted,
+mixed-case name.
+
+Revision ID: 8c2b5e7f4a16
+Revises: 3d9f7a5c2e81
+Create Date: 2026-10-16 13:26:44.061873
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c2b5e7f4a16'
+down_revision: Union[str, Sequence[str], None] = '3d9f7a5c2e81'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+FK_NAME = "fk_audio_features__analysis_record_id__feature_analysis_records"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'audio_features', 'FeatureAnalysisRecord', new_column_name='analysis_record_id'
+    )
+    op.execute(
+        'ALTER INDEX IF EXISTS "ix_audio_features_FeatureAnalysisRecord" '
+        'RENAME TO ix_audio_features_analysis_record_id'
+    )
+    # the old constraint name was past 63 chars and got truncated by the
+    # naming convention, so look it up instead of guessing
+    op.execute(
+        f"""
+        DO $$
+        DECLARE fk text;
+        BEGIN
+            SELECT conname INTO fk FROM pg_constraint
+            WHERE conrelid = 'audio_features'::regclass
+              AND confrelid = 'feature_analysis_records'::regclass
+              AND contype = 'f';
+            IF fk IS NOT NULL AND fk <> '{FK_NAME}' THEN
+                EXECUTE format(
+                    'ALTER TABLE audio_features RENAME CONSTRAINT %I TO %I',
+                    fk, '{FK_NAME}'
+                );
+            END IF;
+        END $$;
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        'ALTER INDEX IF EXISTS ix_audio_features_analysis_record_id '
+        'RENAME TO "ix_audio_features_FeatureAnalysisRecord"'
+    )
+    op.alter_column(
+        'audio_features', 'analysis_record_id', new_column_name='FeatureAnalysisRecord'
+    )
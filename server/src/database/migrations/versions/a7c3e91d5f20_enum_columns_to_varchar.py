@@ -0,0 +1,107 @@
+"""enum columns to varchar
+
+Stores every Enum column as VARCHAR(32) instead of a native PostgreSQL
+ENUM type (models now use Enum(..., native_enum=False, length=32)).
+Stored values (member names) are unchanged.
+
+Revision ID: a7c3e91d5f20
+Revises: 54a014618168
+Create Date: 2026-10-16 10:12:41.218530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e91d5f20'
+down_revision: Union[str, Sequence[str], None] = '54a014618168'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, native enum type)
+ENUM_COLUMNS = [
+    ("models", "type", "analysistype"),
+    ("analysis_records", "analysis_type", "analysistype"),
+    ("separation_analysis_records", "separation_status", "separationstatus"),
+    ("audio_files", "format", "audioformat"),
+    ("audio_files", "status", "audiofilestatus"),
+    ("audio_files", "source_type", "audiosourcetype"),
+    ("separated_audio_files", "source_label", "separatedsourcelabel"),
+    ("audio_features", "feature_type", "featuretype"),
+    ("logs", "entity_type", "entitytype"),
+    ("logs", "log_level", "loglevel"),
+    ("otps", "purpose", "otptype"),
+]
+
+# columns whose server default is typed as the enum and must be re-set
+SERVER_DEFAULTS = {
+    ("separation_analysis_records", "separation_status"): "PENDING",
+}
+
+ENUM_VALUES = {
+    "analysistype": ("EMOTION", "INSTRUMENT", "FEATURES", "SEPARATION"),
+    "separationstatus": ("PENDING", "PROCESSING", "COMPLETED", "FAILED"),
+    "audioformat": ("WAV", "MP3", "FLAC", "AAC", "OGG"),
+    "audiofilestatus": (
+        "UPLOADED",
+        "PROCESSING",
+        "PROCESSED",
+        "FAILED",
+        "PENDING_DELETION",
+    ),
+    "audiosourcetype": ("ORIGINAL", "SEPARATED"),
+    "separatedsourcelabel": ("VOCALS", "DRUMS", "BASS", "OTHER"),
+    "featuretype": (
+        "LOW_LEVEL",
+        "MID_LEVEL",
+        "HIGH_LEVEL",
+        "EMBEDDINGS",
+        "MEL_SPECTROGRAM",
+    ),
+    "entitytype": ("audio_file", "analysis_record", "project"),
+    "loglevel": ("info", "warning", "error", "debug"),
+    "otptype": ("EMAIL_VERIFICATION", "PASSWORD_RESET", "TWO_FACTOR_AUTH"),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, _ in ENUM_COLUMNS:
+        default = SERVER_DEFAULTS.get((table, column))
+        if default is not None:
+            op.execute(f'ALTER TABLE {table} ALTER COLUMN "{column}" DROP DEFAULT')
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN "{column}" '
+            f'TYPE VARCHAR(32) USING "{column}"::text'
+        )
+        if default is not None:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN \"{column}\" SET DEFAULT '{default}'"
+            )
+
+    for type_name in ENUM_VALUES:
+        op.execute(f"DROP TYPE IF EXISTS {type_name}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for type_name, values in ENUM_VALUES.items():
+        labels = ", ".join(f"'{value}'" for value in values)
+        op.execute(f"CREATE TYPE {type_name} AS ENUM ({labels})")
+
+    for table, column, type_name in ENUM_COLUMNS:
+        default = SERVER_DEFAULTS.get((table, column))
+        if default is not None:
+            op.execute(f'ALTER TABLE {table} ALTER COLUMN "{column}" DROP DEFAULT')
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN "{column}" '
+            f'TYPE {type_name} USING "{column}"::{type_name}'
+        )
+        if default is not None:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN \"{column}\" "
+                f"SET DEFAULT '{default}'::{type_name}"
+            )
@@ -0,0 +1,36 @@
+"""index projects.main_audio_id and audio_files.project_id
+
+Both foreign keys were unindexed, so ON DELETE SET NULL / CASCADE and the
+per-project audio listing scanned the whole table. idx_project_user_id
+duplicated ix_projects_user_id from UserReferenceMixin and is dropped.
+
+Revision ID: b4d7e2c9a031
+Revises: 6e1a9d3b7f52
+Create Date: 2026-10-16 14:37:52.318604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d7e2c9a031'
+down_revision: Union[str, Sequence[str], None] = '6e1a9d3b7f52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_projects_main_audio_id'), 'projects', ['main_audio_id'], unique=False)
+    op.create_index(op.f('ix_audio_files_project_id'), 'audio_files', ['project_id'], unique=False)
+    op.create_index(op.f('ix_projects_user_id'), 'projects', ['user_id'], unique=False, if_not_exists=True)
+    op.drop_index('idx_project_user_id', table_name='projects', if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('idx_project_user_id', 'projects', ['user_id'], unique=False)
+    op.drop_index(op.f('ix_audio_files_project_id'), table_name='audio_files')
+    op.drop_index(op.f('ix_projects_main_audio_id'), table_name='projects')
@@ -0,0 +1,65 @@
+"""drop redundant unique constraints on uuid primary keys
+
+UUIDMixin.id declared unique=True on top of primary_key=True, so every
+table carried a second unique B-tree on id next to its primary key.
+
+Revision ID: c41f8b2e6a93
+Revises: a7c3e91d5f20
+Create Date: 2026-10-16 10:47:05.630214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41f8b2e6a93'
+down_revision: Union[str, Sequence[str], None] = 'a7c3e91d5f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = [
+    "users",
+    "projects",
+    "audio_files",
+    "analysis_records",
+    "audio_features",
+    "refresh_tokens",
+    "logs",
+    "models",
+    "otps",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        # A foreign key created while both indexes existed may be bound to
+        # the unique one; keep it in that case rather than cascading
+        op.execute(
+            f"""
+            DO $$
+            BEGIN
+                ALTER TABLE {table} DROP CONSTRAINT IF EXISTS uq_{table}_id;
+            EXCEPTION WHEN dependent_objects_still_exist THEN
+                RAISE NOTICE 'kept uq_{table}_id: a foreign key depends on it';
+            END $$;
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.execute(
+            f"""
+            DO $$
+            BEGIN
+                ALTER TABLE {table} ADD CONSTRAINT uq_{table}_id UNIQUE (id);
+            EXCEPTION WHEN duplicate_table OR duplicate_object THEN
+                NULL;
+            END $$;
+            """
+        )
@@ -0,0 +1,70 @@
+"""store json payload columns as jsonb
+
+Analysis payloads were kept in text-based json columns, re-parsed on every
+read and not indexable; jsonb stores them pre-parsed and supports GIN.
+
+Revision ID: e5d82f6b1c07
+Revises: c41f8b2e6a93
+Create Date: 2026-10-16 11:32:18.402517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5d82f6b1c07'
+down_revision: Union[str, Sequence[str], None] = 'c41f8b2e6a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+JSON_COLUMNS = [
+    ("analysis_records", "results"),
+    ("analysis_records", "summary"),
+    ("emotion_analysis_records", "vgg_embeddings"),
+    ("emotion_analysis_records", "prediction_result"),
+    ("instrument_analysis_records", "instruments"),
+    ("instrument_analysis_records", "confidence_scores"),
+    ("feature_analysis_records", "feature_vector"),
+    ("audio_features", "data"),
+    ("logs", "data"),
+]
+
+GIN_INDEXES = [
+    (
+        "ix_emotion_analysis_records_prediction_gin",
+        "emotion_analysis_records",
+        "prediction_result",
+    ),
+    (
+        "ix_instrument_analysis_records_confidence_gin",
+        "instrument_analysis_records",
+        "confidence_scores",
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in JSON_COLUMNS:
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN "{column}" '
+            f'TYPE JSONB USING "{column}"::jsonb'
+        )
+
+    for name, table, column in GIN_INDEXES:
+        op.create_index(name, table, [column], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in GIN_INDEXES:
+        op.drop_index(name, table_name=table)
+
+    for table, column in JSON_COLUMNS:
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN "{column}" '
+            f'TYPE JSON USING "{column}"::json'
+        )
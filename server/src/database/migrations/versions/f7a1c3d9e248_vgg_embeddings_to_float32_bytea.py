@@ -0,0 +1,98 @@
+"""store vgg_embeddings as raw float32 bytes
+
+JSON arrays of floats are ~10x the size of the raw float32 data and have to
+be parsed on every read; the column now holds little-endian float32 rows of
+128 values (see src.database.types.Float32Array).
+
+Revision ID: f7a1c3d9e248
+Revises: e5d82f6b1c07
+Create Date: 2026-10-16 11:58:40.127365
+
+"""
+from typing import Sequence, Union
+
+import numpy as np
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7a1c3d9e248'
+down_revision: Union[str, Sequence[str], None] = 'e5d82f6b1c07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLE = "emotion_analysis_records"
+COLUMN = "vgg_embeddings"
+DIM = 128
+
+
+BATCH = 1000
+
+
+def _swap_column(new_type, convert) -> None:
+    """Re-type COLUMN through a temp column; rows are converted in Python."""
+    tmp = f"{COLUMN}_new"
+    op.add_column(TABLE, sa.Column(tmp, new_type, nullable=True))
+
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.text(f"SELECT id, {COLUMN} FROM {TABLE} WHERE {COLUMN} IS NOT NULL")
+    ).all()
+
+    converted, bad_ids = [], []
+    for row_id, value in rows:
+        try:
+            converted.append((row_id, convert(value)))
+        except ValueError:
+            bad_ids.append(str(row_id))
+    if bad_ids:
+        raise RuntimeError(
+            f"{TABLE}.{COLUMN} holds embeddings that are not rows of {DIM} "
+            f"floats; fix or clear them before migrating: {', '.join(bad_ids)}"
+        )
+
+    # one UPDATE ... FROM (VALUES ...) per batch instead of a round trip per row
+    table = sa.table(TABLE, sa.column("id"), sa.column(tmp))
+    for start in range(0, len(converted), BATCH):
+        batch = sa.values(
+            sa.column("id", postgresql.UUID(as_uuid=True)),
+            sa.column("value", new_type),
+            name="converted",
+        ).data(converted[start:start + BATCH])
+        conn.execute(
+            table.update()
+            .where(table.c.id == batch.c.id)
+            .values({tmp: batch.c.value})
+        )
+
+    op.drop_column(TABLE, COLUMN)
+    op.alter_column(TABLE, tmp, new_column_name=COLUMN)
+
+
+def _to_bytes(value) -> bytes | None:
+    # legacy rows may hold {"data": [...]} rather than a bare array
+    if isinstance(value, dict):
+        value = value.get("data")
+    if value is None:
+        return None
+    array = np.asarray(value, dtype="<f4")
+    if array.size % DIM:
+        raise ValueError(f"{array.size} values is not a multiple of {DIM}")
+    return array.tobytes()
+
+
+def _to_json(value: bytes) -> list:
+    return np.frombuffer(value, dtype="<f4").reshape(-1, DIM).tolist()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _swap_column(sa.LargeBinary(), _to_bytes)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _swap_column(postgresql.JSONB(), _to_json)
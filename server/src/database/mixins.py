@@ -1,3 +1,5 @@
+import os
+import time
 import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
@@ -17,14 +19,34 @@ if TYPE_CHECKING:
     from .models.user import User
 
 
+def _reference_column(target: str) -> Mapped:
+    # ForeignKey objects bind to a single Column, so each subclass needs a fresh
+    # one; only the spec is shared
+    return mapped_column(
+        ForeignKey(target, ondelete="CASCADE"), nullable=False, index=True
+    )
+
+
+def uuid7() -> uuid.UUID:
+    """
+    RFC 9562 UUIDv7: 48-bit unix-ms timestamp followed by random bits.
+    Time-ordered, so primary-key inserts land on the right edge of the
+    B-tree instead of a random leaf page.
+    """
+    ts_ms = time.time_ns() // 1_000_000
+    value = (ts_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10))
+    value = value & ~(0xF << 76) | 0x7 << 76  # version
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 class UUIDMixin:
     """Mixin to add a UUID primary key column to a SQLAlchemy model."""
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        unique=True,
+        default=uuid7,
         nullable=False,
     )
 
@@ -52,9 +74,7 @@ class UserReferenceMixin:
 
     @declared_attr
     def user_id(cls) -> Mapped[str]:
-        return mapped_column(
-            ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
-        )
+        return _reference_column("users.id")
 
     @declared_attr
     def user(cls) -> Mapped["User"]:
@@ -62,7 +82,8 @@ class UserReferenceMixin:
             "User",
             back_populates=cls.__tablename__,
             foreign_keys=[cls.user_id],
-            lazy="selectin",
+            # opt in with selectinload() where needed; never load implicitly
+            lazy="raise_on_sql",
         )
 
 
@@ -70,9 +91,7 @@ class UserReferenceMixin:
 class AudioFileReferenceMixin:
     @declared_attr
     def audio_file_id(cls) -> Mapped[uuid.UUID]:
-        return mapped_column(
-            ForeignKey("audio_files.id", ondelete="CASCADE"), nullable=False, index=True
-        )
+        return _reference_column("audio_files.id")
 
     @declared_attr
     def audio_file(cls) -> Mapped["AudioFile"]:
@@ -80,5 +99,5 @@ class AudioFileReferenceMixin:
             "AudioFile",
             back_populates=cls.__tablename__,
             foreign_keys=[cls.audio_file_id],
-            lazy="selectin",
+            lazy="raise_on_sql",
         )
@@ -1,7 +1,10 @@
 import uuid
 from typing import TYPE_CHECKING, List
+
+import numpy as np
 from src.database.enums import AnalysisType, SeparationStatus 
-from sqlalchemy import JSON, Enum, ForeignKey, Text, UniqueConstraint
+from sqlalchemy import Enum, ForeignKey, Index, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.base import Base
@@ -11,11 +14,7 @@ from src.database.mixins import (
     UUIDMixin,
 )
 from src.database.models.audio_file import SeparatedAudioFile
-from src.models.emotion_recognition.pipeline.postprocessor import (
-    CombinedPrediction,
-    DynamicPrediction,
-    StaticPrediction,
-)
+from src.database.types import Float32Array
 
 
 if TYPE_CHECKING:
@@ -28,9 +27,11 @@ class AnalysisRecord(
     AudioFileReferenceMixin,
     Base,
 ):
-    analysis_type: Mapped[AnalysisType] = mapped_column(Enum(AnalysisType))
-    results: Mapped[dict] = mapped_column(JSON)
-    summary: Mapped[dict] = mapped_column(JSON, nullable=True)
+    analysis_type: Mapped[AnalysisType] = mapped_column(
+        Enum(AnalysisType, native_enum=False, length=32)
+    )
+    results: Mapped[dict] = mapped_column(JSONB)
+    summary: Mapped[dict] = mapped_column(JSONB, nullable=True)
 
     project_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("projects.id", ondelete="CASCADE"),
@@ -41,10 +42,11 @@ class AnalysisRecord(
     model_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey("models.id", ondelete="SET NULL"),
         nullable=True,
+        index=True,
     )
 
     model: Mapped["Model"] = relationship(
-        "Model", back_populates="analysis_records", lazy="selectin"
+        "Model", back_populates="analysis_records", lazy="raise_on_sql"
     )
 
     __table_args__ = (
@@ -63,12 +65,22 @@ class EmotionAnalysisRecord(AnalysisRecord):
     id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("analysis_records.id"), primary_key=True
     )
-    vgg_embeddings: Mapped[dict | list | None] = mapped_column(JSON, nullable=True)
-    prediction_result: Mapped[
-        StaticPrediction | DynamicPrediction | CombinedPrediction
-    ] = mapped_column(JSON)
+    # VGGish frames, one 128-d float32 row per segment
+    vgg_embeddings: Mapped[np.ndarray | None] = mapped_column(
+        Float32Array(128), nullable=True
+    )
+    # serialized Static/Dynamic/CombinedPrediction (see emotion postprocessor)
+    prediction_result: Mapped[dict] = mapped_column(JSONB)
     project: Mapped["Project"] = relationship(
-        "Project", back_populates="emotion_analysis_record"
+        "Project", back_populates="emotion_analysis_record", lazy="raise_on_sql"
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_emotion_analysis_records_prediction_gin",
+            "prediction_result",
+            postgresql_using="gin",
+        ),
     )
 
     __mapper_args__ = {
@@ -80,10 +92,18 @@ class InstrumentAnalysisRecord(AnalysisRecord):
     id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("analysis_records.id"), primary_key=True
     )
-    instruments: Mapped[list[str]] = mapped_column(JSON)
-    confidence_scores: Mapped[dict] = mapped_column(JSON)
+    instruments: Mapped[list[str]] = mapped_column(JSONB)
+    confidence_scores: Mapped[dict] = mapped_column(JSONB)
     project: Mapped["Project"] = relationship(
-        "Project", back_populates="instrument_analysis_record"
+        "Project", back_populates="instrument_analysis_record", lazy="raise_on_sql"
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_instrument_analysis_records_confidence_gin",
+            "confidence_scores",
+            postgresql_using="gin",
+        ),
     )
 
     __mapper_args__ = {
@@ -95,12 +115,12 @@ class FeatureAnalysisRecord(AnalysisRecord):
     id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("analysis_records.id"), primary_key=True
     )
-    feature_vector: Mapped[dict] = mapped_column(JSON)
+    feature_vector: Mapped[dict] = mapped_column(JSONB)
     audio_features: Mapped[list["AudioFeature"]] = relationship(
         "AudioFeature", back_populates="feature_analysis_record", lazy="selectin"
     )
     project: Mapped["Project"] = relationship(
-        "Project", back_populates="feature_analysis_record"
+        "Project", back_populates="feature_analysis_record", lazy="raise_on_sql"
     )
 
     __mapper_args__ = {
@@ -114,7 +134,7 @@ class SeparationAnalysisRecord(AnalysisRecord):
     )
     
     separation_status: Mapped[SeparationStatus] = mapped_column(  # 👈 add this
-        Enum(SeparationStatus),
+        Enum(SeparationStatus, native_enum=False, length=32),
         default=SeparationStatus.PENDING,
         nullable=False,
     )
@@ -125,9 +145,11 @@ class SeparationAnalysisRecord(AnalysisRecord):
         cascade="all, delete-orphan",
         back_populates="separation_analysis_record",
         single_parent=True,
+        # audio_files also links back through analysis_records.audio_file_id
+        foreign_keys="SeparatedAudioFile.separation_analysis_id",
     )
     project: Mapped["Project"] = relationship(
-        "Project", back_populates="separation_analysis_record"
+        "Project", back_populates="separation_analysis_record", lazy="raise_on_sql"
     )
 
     __mapper_args__ = {
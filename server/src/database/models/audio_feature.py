@@ -1,7 +1,8 @@
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import JSON, Enum, ForeignKey
+from sqlalchemy import Enum, ForeignKey
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.base import Base
@@ -14,7 +15,6 @@ if TYPE_CHECKING:
 
 class AudioFeature(UUIDMixin, TimestampMixin, AudioFileReferenceMixin, Base):
     analysis_record_id: Mapped[uuid.UUID] = mapped_column(
-        "FeatureAnalysisRecord",
         ForeignKey("feature_analysis_records.id", ondelete="CASCADE"),
         index=True,
         nullable=False,
@@ -23,6 +23,6 @@ class AudioFeature(UUIDMixin, TimestampMixin, AudioFileReferenceMixin, Base):
         "FeatureAnalysisRecord", back_populates="audio_features", lazy="selectin"
     )
     feature_type: Mapped[FeatureType] = mapped_column(
-        Enum(FeatureType), default=FeatureType.LOW_LEVEL
+        Enum(FeatureType, native_enum=False, length=32), default=FeatureType.LOW_LEVEL
     )
-    data: Mapped[dict] = mapped_column(JSON)
+    data: Mapped[dict] = mapped_column(JSONB)
@@ -3,7 +3,6 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from sqlalchemy import BigInteger, DateTime, Enum, Float, ForeignKey, Integer, String
-from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.base import Base
@@ -35,14 +34,15 @@ class AudioFile(UUIDMixin, TimestampMixin, Base):
     sample_rate: Mapped[int | None] = mapped_column(Integer, nullable=True)
     channels: Mapped[int] = mapped_column(Integer)
     format: Mapped[AudioFormat] = mapped_column(
-        Enum(AudioFormat), default=AudioFormat.MP3
+        Enum(AudioFormat, native_enum=False, length=32), default=AudioFormat.MP3
     )
     checksum: Mapped[str] = mapped_column(String(128), unique=True)
     status: Mapped[AudioFileStatus] = mapped_column(
-        Enum(AudioFileStatus), default=AudioFileStatus.UPLOADED
+        Enum(AudioFileStatus, native_enum=False, length=32),
+        default=AudioFileStatus.UPLOADED,
     )
     project_id: Mapped[uuid.UUID | None] = mapped_column(
-        ForeignKey("projects.id", ondelete="CASCADE")
+        ForeignKey("projects.id", ondelete="CASCADE"), index=True
     )
 
     scheduled_deletion_at: Mapped[datetime | None] = mapped_column(
@@ -51,37 +51,47 @@ class AudioFile(UUIDMixin, TimestampMixin, Base):
 
     # Discriminator
     source_type: Mapped[AudioSourceType] = mapped_column(
-        Enum(AudioSourceType), default=AudioSourceType.ORIGINAL, nullable=False
+        Enum(AudioSourceType, native_enum=False, length=32),
+        default=AudioSourceType.ORIGINAL,
+        nullable=False,
     )
 
     # Relationships
+    # Nothing here is eager by default: every AudioFile load (including the
+    # ones pulled in by Project.main_audio / parent_audio) used to fan out into
+    # a SELECT per collection. Callers opt in with selectinload().
     project: Mapped["Project"] = relationship(
         "Project",
         back_populates="main_audio",
         foreign_keys="[Project.main_audio_id]",
-        lazy="selectin",
+        lazy="raise_on_sql",
         uselist=False,
+        passive_deletes=True,  # projects.main_audio_id is ON DELETE SET NULL
     )
     analysis_records: Mapped[list["AnalysisRecord"]] = relationship(
         "AnalysisRecord",
         back_populates="audio_file",
-        lazy="selectin",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     separated_sources: Mapped[list["SeparatedAudioFile"]] = relationship(
         "SeparatedAudioFile",
         back_populates="parent_audio",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        # plain lazy load so the ORM delete cascade (no DB-side cascade on
+        # parent_audio_id) can still fetch the stems inside session.delete()
+        lazy="select",
         foreign_keys="SeparatedAudioFile.parent_audio_id",
     )
 
     audio_features: Mapped[list["AudioFeature"]] = relationship(
         "AudioFeature",
         back_populates="audio_file",
-        lazy="selectin",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     __mapper_args__ = {
@@ -91,20 +101,19 @@ class AudioFile(UUIDMixin, TimestampMixin, Base):
 
 
 class SeparatedAudioFile(AudioFile):
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("audio_files.id", ondelete="CASCADE"),
-        primary_key=True,
-    )
+    # Single-table inheritance: stems are audio_files rows told apart by
+    # source_type, so loading one (or a separated_sources collection) never
+    # joins a second table. Subclass columns must stay nullable.
+    __tablename__ = None
 
-    parent_audio_id: Mapped[uuid.UUID] = mapped_column(
+    parent_audio_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey("audio_files.id"),
         index=True,
-        nullable=False,
+        nullable=True,
     )
 
-    source_label: Mapped[SeparatedSourceLabel] = mapped_column(
-        Enum(SeparatedSourceLabel)
+    source_label: Mapped[SeparatedSourceLabel | None] = mapped_column(
+        Enum(SeparatedSourceLabel, native_enum=False, length=32), nullable=True
     )
 
     parent_audio: Mapped["AudioFile"] = relationship(
@@ -124,9 +133,9 @@ class SeparatedAudioFile(AudioFile):
         "SeparationAnalysisRecord",
         back_populates="separated_files",  # ✅ reciprocal link
         lazy="selectin",
+        foreign_keys=[separation_analysis_id],
     )
 
     __mapper_args__ = {
         "polymorphic_identity": AudioSourceType.SEPARATED,
-        "inherit_condition": id == AudioFile.id,
     }
@@ -1,6 +1,7 @@
 import uuid
 
-from sqlalchemy import JSON, Enum, Index, Text
+from sqlalchemy import Enum, Index, Text, desc
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.database.base import Base
@@ -14,16 +15,24 @@ from src.database.mixins import (
 
 class Log(UUIDMixin, TimestampMixin, UserReferenceMixin, Base):
     entity_id: Mapped[uuid.UUID] = mapped_column(nullable=False, index=True)
-    entity_type: Mapped[EntityType] = mapped_column(Enum(EntityType), nullable=False)
+    entity_type: Mapped[EntityType] = mapped_column(
+        Enum(EntityType, native_enum=False, length=32), nullable=False
+    )
 
     message: Mapped[str] = mapped_column(Text, nullable=False)
     log_level: Mapped[LogLevel] = mapped_column(
-        Enum(LogLevel), default=LogLevel.info, nullable=False
+        Enum(LogLevel, native_enum=False, length=32),
+        default=LogLevel.info,
+        nullable=False,
     )
 
-    data: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    data: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
 
-    __table_args__ = (Index("ix_logs_entity_ref", "entity_type", "entity_id"),)
+    # entity lookups read newest-first; the trailing created_at DESC lets
+    # "latest N for this entity" walk the index instead of sorting
+    __table_args__ = (
+        Index("ix_logs_entity_recent", "entity_type", "entity_id", desc("created_at")),
+    )
 
     def __repr__(self) -> str:
         return (
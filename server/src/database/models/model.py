@@ -13,11 +13,16 @@ if TYPE_CHECKING:
 
 class Model(UUIDMixin, TimestampMixin, Base):
     name: Mapped[str] = mapped_column(String(100), nullable=False)
-    type: Mapped[AnalysisType] = mapped_column(Enum(AnalysisType))
+    type: Mapped[AnalysisType] = mapped_column(
+        Enum(AnalysisType, native_enum=False, length=32)
+    )
     version: Mapped[str] = mapped_column(String(50), default="v1.0")
     description: Mapped[str | None] = mapped_column(Text)
     checkpoint_path: Mapped[str | None] = mapped_column(String(500))
 
     analysis_records: Mapped[list["AnalysisRecord"]] = relationship(
-        "AnalysisRecord", back_populates="model", lazy="selectin"
+        "AnalysisRecord",
+        back_populates="model",
+        lazy="raise_on_sql",
+        passive_deletes=True,  # analysis_records.model_id is ON DELETE SET NULL
     )
@@ -13,7 +13,7 @@ class Otp(UUIDMixin, TimestampMixin, UserReferenceMixin, Base):
     code: Mapped[str] = mapped_column(String(CONSTANTS.OTP_LENGTH), nullable=False)
     email: Mapped[str] = mapped_column(String(255), nullable=False)
     purpose: Mapped[OtpType] = mapped_column(
-        Enum(OtpType), default=OtpType.EMAIL_VERIFICATION
+        Enum(OtpType, native_enum=False, length=32), default=OtpType.EMAIL_VERIFICATION
     )
     is_used: Mapped[bool] = mapped_column(Boolean, default=False)
     expires_at: Mapped[datetime.datetime] = mapped_column(
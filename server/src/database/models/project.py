@@ -1,7 +1,7 @@
 import uuid
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import ForeignKey, Index, String, Text
+from sqlalchemy import ForeignKey, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -28,17 +28,21 @@ class Project(UUIDMixin, TimestampMixin, UserReferenceMixin, Base):
 
     # 1-to-1 main/original audio
     main_audio_id: Mapped[uuid.UUID | None] = mapped_column(
-        ForeignKey("audio_files.id", ondelete="SET NULL")
+        ForeignKey("audio_files.id", ondelete="SET NULL"), index=True
     )
 
     main_audio: Mapped["AudioFile"] = relationship(
         "AudioFile",
         back_populates="project",
         foreign_keys=[main_audio_id],
-        lazy="selectin",
+        # FK lives on projects: fold it into the project SELECT as a LEFT JOIN
+        lazy="joined",
+        innerjoin=False,
         uselist=False,
     )
 
+    # Collections and analysis records load only on request (PROJECT_POPULATE
+    # in the repo); a bare Project load is a single SELECT.
     emotion_analysis_record: Mapped[Optional["EmotionAnalysisRecord"]] = relationship(
         "EmotionAnalysisRecord",
         primaryjoin="and_(Project.id==EmotionAnalysisRecord.project_id, "
@@ -47,7 +51,7 @@ class Project(UUIDMixin, TimestampMixin, UserReferenceMixin, Base):
         cascade="all, delete-orphan",
         passive_deletes=True,
         uselist=False,
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     instrument_analysis_record: Mapped[Optional["InstrumentAnalysisRecord"]] = (
@@ -59,7 +63,7 @@ class Project(UUIDMixin, TimestampMixin, UserReferenceMixin, Base):
             uselist=False,
             cascade="all, delete-orphan",
             passive_deletes=True,
-            lazy="selectin",
+            lazy="raise_on_sql",
         )
     )
 
@@ -71,7 +75,7 @@ class Project(UUIDMixin, TimestampMixin, UserReferenceMixin, Base):
         uselist=False,
         cascade="all, delete-orphan",
         passive_deletes=True,
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     separation_analysis_record: Mapped[Optional["SeparationAnalysisRecord"]] = (
@@ -83,27 +87,17 @@ class Project(UUIDMixin, TimestampMixin, UserReferenceMixin, Base):
             uselist=False,
             cascade="all, delete-orphan",
             passive_deletes=True,
-            lazy="selectin",
+            lazy="raise_on_sql",
         )
     )
 
     # convenience accessor — all separated audios for this project
     separated_audios: Mapped[List["SeparatedAudioFile"]] = relationship(
         "SeparatedAudioFile",
-        secondary="audio_files",  # implicit join via AudioFile.project_id
+        # stems carry their project's id; the source_type criterion is added
+        # by the single-table mapper
         viewonly=True,
-        primaryjoin="Project.id == AudioFile.project_id",
-        secondaryjoin="AudioFile.id == SeparatedAudioFile.parent_audio_id",
-        lazy="selectin",
+        primaryjoin="Project.id == SeparatedAudioFile.project_id",
+        foreign_keys="SeparatedAudioFile.project_id",
+        lazy="raise_on_sql",
     )
-
-    @property
-    def all_audio_files(self):
-        audios = []
-        if self.main_audio:
-            audios.append(self.main_audio)
-        if self.separated_audios:
-            audios.extend(self.separated_audios)
-        return audios
-
-    __table_args__ = (Index("idx_project_user_id", "user_id"),)
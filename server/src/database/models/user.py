@@ -19,17 +19,33 @@ class User(UUIDMixin, TimestampMixin, Base):
     email_verified: Mapped[bool] = mapped_column(Boolean, default=False)
 
     otps: Mapped[list["Otp"]] = relationship(
-        "Otp", back_populates="user", cascade="all, delete-orphan"
+        "Otp",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     projects: Mapped[List["Project"]] = relationship(
-        "Project", back_populates="user", cascade="all, delete-orphan"
+        "Project",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     logs: Mapped[List["Log"]] = relationship(
-        "Log", back_populates="user", cascade="all, delete-orphan"
+        "Log",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     refresh_tokens: Mapped[List["RefreshToken"]] = relationship(
-        "RefreshToken", back_populates="user", cascade="all, delete-orphan"
+        "RefreshToken",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
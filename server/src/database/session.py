@@ -1,8 +1,9 @@
 import asyncio
 import logging
 import time
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
+import orjson
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
@@ -17,6 +18,20 @@ from src.core.settings import CONSTANTS
 logger = logging.getLogger(__name__)
 _engine: AsyncEngine | None = None
 
+_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _json_default(value: Any) -> Any:
+    # torch.Tensor, duck-typed so the DB layer doesn't import torch;
+    # the resulting ndarray is serialized natively via OPT_SERIALIZE_NUMPY
+    if hasattr(value, "detach"):
+        return value.detach().cpu().numpy()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _json_serializer(value: Any) -> str:
+    return orjson.dumps(value, default=_json_default, option=_JSON_OPTIONS).decode()
+
 
 def get_engine():
     global _engine
@@ -25,13 +40,46 @@ def get_engine():
             # CONSTANTS.ASYNC_DATABASE_URL,
             CONSTANTS.ASYNC_POOLER_DATABASE_URL,
             echo=CONSTANTS.DEBUG,
+            pool_size=CONSTANTS.DB_POOL_SIZE,
+            max_overflow=CONSTANTS.DB_MAX_OVERFLOW,
+            pool_timeout=CONSTANTS.DB_POOL_TIMEOUT,
+            pool_recycle=CONSTANTS.DB_POOL_RECYCLE,
             pool_pre_ping=True,  # helps recover stale Supabase connections
-            future=True,
-            poolclass=None,
+            connect_args={"server_settings": {"application_name": "musimo-api"}},
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads,
         )
     return _engine
 
 
+_health_engine: AsyncEngine | None = None
+
+
+def get_health_engine() -> AsyncEngine:
+    """
+    Tiny dedicated pool for health-check pings, so probes never queue behind
+    (or starve) application traffic on the main engine.
+    """
+    global _health_engine
+    if _health_engine is None:
+        _health_engine = create_async_engine(
+            CONSTANTS.ASYNC_POOLER_DATABASE_URL,
+            pool_size=1,
+            max_overflow=1,
+            pool_timeout=5,
+            pool_pre_ping=True,
+        )
+    return _health_engine
+
+
+async def dispose_health_engine() -> None:
+    """Dispose the health-check pool, if a probe ever created it."""
+    global _health_engine
+    if _health_engine is not None:
+        await _health_engine.dispose()
+        _health_engine = None
+
+
 _sessionmaker: async_sessionmaker[AsyncSession] | None = None
 
 
@@ -66,19 +114,27 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
-async def test_db_connection() -> dict:
+async def test_db_connection(
+    engine: AsyncEngine | None = None, timeout: float = 3.0
+) -> dict:
     """
-    Pings the existing SQLAlchemy async engine to verify connectivity.
-    Returns True if DB is reachable, False otherwise.
+    Pings the given (default: the app's) SQLAlchemy async engine to verify
+    connectivity, giving up after `timeout` seconds so an unreachable DB
+    can't stall warmup or health checks.
+    Returns {"ok": bool, "latency_ms": float | None}.
     """
     start = time.perf_counter()
-    engine = get_engine()
+    engine = engine or get_engine()
     try:
-        async with engine.connect() as conn:
-            result = await conn.execute(text("SELECT 1"))
-            ok = result.scalar() == 1
-            latency_ms = round((time.perf_counter() - start) * 1000, 2)
-            return {"ok": ok, "latency_ms": latency_ms}
+        async with asyncio.timeout(timeout):
+            async with engine.connect() as conn:
+                result = await conn.execute(text("SELECT 1"))
+                ok = result.scalar() == 1
+        latency_ms = round((time.perf_counter() - start) * 1000, 2)
+        return {"ok": ok, "latency_ms": latency_ms}
+    except TimeoutError:
+        logger.critical(f"❌ Database connection test timed out after {timeout}s")
+        return {"ok": False, "latency_ms": None}
     except SQLAlchemyError as e:
         logger.error(f"❌ Database connection test failed: {e}")
         return {"ok": False, "latency_ms": None}
@@ -0,0 +1,35 @@
+import numpy as np
+from sqlalchemy import LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+
+class Float32Array(TypeDecorator):
+    """
+    Fixed-width float32 vectors stored as raw little-endian bytes (BYTEA).
+    Accepts lists, ndarrays or torch tensors; loads as a (n, dim) ndarray
+    without any JSON parsing.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, dim: int):
+        super().__init__()
+        self.dim = dim
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if hasattr(value, "detach"):  # torch.Tensor
+            value = value.detach().cpu().numpy()
+        array = np.asarray(value, dtype="<f4")
+        if array.size % self.dim:
+            raise ValueError(
+                f"expected a multiple of {self.dim} values, got {array.size}"
+            )
+        return array.tobytes()
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return np.frombuffer(value, dtype="<f4").reshape(-1, self.dim)
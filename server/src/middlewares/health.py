@@ -0,0 +1,52 @@
+# src/middlewares/health.py
+import time
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Pre-rendered /health response, re-rendered by the route once it goes stale
+_health_body: bytes | None = None
+_health_headers: tuple[tuple[bytes, bytes], ...] = ()
+_health_expires: float = 0.0
+
+
+def set_health_body(body: bytes, ttl: float) -> None:
+    global _health_body, _health_headers, _health_expires
+    # Encoded once per refresh, not per request
+    _health_headers = (
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+    )
+    _health_body = body
+    _health_expires = time.monotonic() + ttl
+
+
+class HealthFastPathMiddleware:
+    """
+    Serves GET /health straight from the pre-rendered body, skipping routing,
+    dependency resolution and every inner middleware. Falls through to the
+    regular route while the body is missing or older than its TTL, and the
+    route renders a fresh one.
+    """
+
+    def __init__(self, app: ASGIApp, path: str) -> None:
+        self.app = app
+        self.path = path
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        body, headers = _health_body, _health_headers
+        if (
+            body is None
+            or time.monotonic() >= _health_expires
+            or scope["type"] != "http"
+            or scope["path"] != self.path
+            or scope["method"] != "GET"
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        # Outer middlewares (GZip, CORS) edit the header list in place, so
+        # each response gets its own list built from the cached tuples
+        await send(
+            {"type": "http.response.start", "status": 200, "headers": list(headers)}
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -9,6 +9,8 @@ from typing import Tuple
 import librosa
 import numpy as np
 
+from src.core.settings import CONSTANTS
+
 logger = logging.getLogger(__name__)
 
 
@@ -162,10 +164,12 @@ class AudioPreprocessor:
             )
 
         # Check file extension
-        allowed_exts = {".mp3", ".wav", ".ogg", ".flac", ".m4a"}
         ext = os.path.splitext(file_path)[1].lower()
+        allowed_exts = CONSTANTS.ALLOWED_AUDIO_EXT_SET
         if ext not in allowed_exts:
-            raise ValueError(f"Unsupported format: {ext}. Allowed: {allowed_exts}")
+            raise ValueError(
+                f"Unsupported format: {ext}. Allowed: {sorted(allowed_exts)}"
+            )
 
         logger.info(f"Audio file validated: {file_path} ({file_size_mb:.2f}MB)")
         return True
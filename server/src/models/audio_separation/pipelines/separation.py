@@ -426,6 +426,7 @@ from sqlalchemy import select
 
 from src.core.settings import CONSTANTS
 from src.database.enums import AudioFileStatus, AudioFormat, SeparatedSourceLabel
+from src.database.mixins import uuid7
 from src.database.models import AudioFile, SeparatedAudioFile
 from src.database.session import get_sessionmaker
 from src.models.audio_separation.file_utils import (
@@ -501,7 +502,7 @@ async def process_stem(
  
         # Build ORM object but do NOT call db.add() here
         separated = SeparatedAudioFile(
-            id=uuid.uuid4(),
+            id=uuid7(),
             parent_audio_id=uuid.UUID(audio_id),
             project_id=uuid.UUID(project_id),
             file_path=storage_path,
@@ -547,10 +548,7 @@ async def separate_audio_pipeline(
         with tempfile.TemporaryDirectory() as temp_dir:
             output_dir = Path(temp_dir)
 
-            result = await db.execute(
-                select(AudioFile).where(AudioFile.id == uuid.UUID(audio_id))
-            )
-            audio_record = result.scalar_one_or_none()
+            audio_record = await db.get(AudioFile, uuid.UUID(audio_id))
 
             if audio_record:
                 audio_record.status = AudioFileStatus.PROCESSING
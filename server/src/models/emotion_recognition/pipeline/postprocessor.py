@@ -13,8 +13,11 @@ class StaticPrediction:
     num_segments: int
     model_version: str = "GEMS-9"
 
+    def to_dict(self):
+        return asdict(self)
+
     def to_json(self):
-        return json.dumps(asdict(self), indent=2)
+        return json.dumps(self.to_dict(), indent=2)
 
 
 @dataclass
@@ -24,8 +27,11 @@ class DynamicPrediction:
     duration_seconds: float
     segment_duration: float
 
+    def to_dict(self):
+        return asdict(self)
+
     def to_json(self):
-        return json.dumps(asdict(self), indent=2)
+        return json.dumps(self.to_dict(), indent=2)
 
 
 @dataclass
@@ -33,10 +39,11 @@ class CombinedPrediction:
     static: StaticPrediction
     dynamic: DynamicPrediction
 
+    def to_dict(self):
+        return {"static": asdict(self.static), "dynamic": asdict(self.dynamic)}
+
     def to_json(self):
-        return json.dumps(
-            {"static": asdict(self.static), "dynamic": asdict(self.dynamic)}, indent=2
-        )
+        return json.dumps(self.to_dict(), indent=2)
 
 
 class EmotionPostprocessor:
@@ -64,8 +71,9 @@ class EmotionPostprocessor:
 
 
 def format_prediction_result(result) -> Dict:
-    if hasattr(result, "to_json"):
-        return json.loads(result.to_json())
+    # plain dicts of floats/lists: no json.dumps -> json.loads round trip
+    if hasattr(result, "to_dict"):
+        return result.to_dict()
     elif isinstance(result, dict):
         return result
     else:
@@ -2,10 +2,11 @@
 ML Model service for emotion detection and instrument classification
 """
 
-import json
+import asyncio
 import logging
 import os
 import sys
+import threading
 from typing import Dict, Optional
 
 from src.models.progress_tracker import ProgressTracker
@@ -45,8 +46,9 @@ def validate_prediction_type(prediction_type: str) -> PredictionType:
 
 
 def format_prediction_result(result) -> Dict:
-    if hasattr(result, "to_json"):
-        return json.loads(result.to_json())
+    # plain dicts of floats/lists: no json.dumps -> json.loads round trip
+    if hasattr(result, "to_dict"):
+        return result.to_dict()
     elif isinstance(result, dict):
         return result
     else:
@@ -59,13 +61,23 @@ def format_prediction_result(result) -> Dict:
 class ModelService:
     # =========================== EMOTION PREDICTION ===========================
     emotion_pipeline = None
+    _emotion_init_lock = threading.Lock()
 
     @classmethod
     def initialize_emotion_pipeline(cls):
         """Initialize emotion detection pipeline"""
         if cls.emotion_pipeline is None:
-            config = ConfigManager.load_from_json()
-            cls.emotion_pipeline = GEMS9Pipeline(config)
+            # the startup warmup and an early request may race to get here
+            with cls._emotion_init_lock:
+                if cls.emotion_pipeline is None:
+                    config = ConfigManager.load_from_json()
+                    cls.emotion_pipeline = GEMS9Pipeline(config)
+
+    @classmethod
+    async def ensure_emotion_pipeline(cls):
+        """Wait for the pipeline (loading it, or joining the warmup) off the loop"""
+        if cls.emotion_pipeline is None:
+            await asyncio.to_thread(cls.initialize_emotion_pipeline)
 
     @classmethod
     async def predict_emotion(
@@ -84,7 +96,7 @@ class ModelService:
             Dict with emotion prediction results
         """
         prediction_type = validate_prediction_type(prediction_type)
-        ModelService.initialize_emotion_pipeline()
+        await cls.ensure_emotion_pipeline()
         result = await cls.emotion_pipeline.predict(audio_path, prediction_type)
         return format_prediction_result(result)
 
@@ -107,7 +119,7 @@ class ModelService:
             Dict with emotion prediction results
         """
         prediction_type = validate_prediction_type(prediction_type)
-        ModelService.initialize_emotion_pipeline()
+        await cls.ensure_emotion_pipeline()
 
         # Use the tracked version of predict_async
         result = await cls.emotion_pipeline.predict_async(
@@ -1,5 +1,6 @@
 import uuid
 
+import numpy as np
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -44,7 +45,7 @@ class AnalysisRepository:
         prediction_result: dict,
         summary: dict,
         results: dict,
-        embeddings: dict | list | None = None,
+        embeddings: np.ndarray | list | None = None,
     ) -> EmotionAnalysisRecord:
 
         row = EmotionAnalysisRecord(
@@ -72,7 +73,7 @@ class AnalysisRepository:
         prediction_result: dict,
         summary: dict,
         results: dict,
-        embeddings: dict | list | None = None,
+        embeddings: np.ndarray | list | None = None,
     ) -> EmotionAnalysisRecord:
 
         record.prediction_result = prediction_result
@@ -186,4 +187,4 @@ class AnalysisRepository:
         await self._session.flush()
         await self._session.refresh(record)
 
-        return record
\ No newline at end of file
+        return record
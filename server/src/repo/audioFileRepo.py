@@ -9,13 +9,32 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.database.enums import AudioFileStatus, AudioSourceType
 from src.database.models.audio_file import AudioFile
 from src.schemas.audioFile import AudioFileCreateDTO
 
+# Everything AudioFileResponse reads; listing selects just these columns
+LIST_COLUMNS = (
+    AudioFile.id,
+    AudioFile.project_id,
+    AudioFile.file_name,
+    AudioFile.file_size,
+    AudioFile.file_path,
+    AudioFile.duration,
+    AudioFile.sample_rate,
+    AudioFile.channels,
+    AudioFile.format,
+    AudioFile.checksum,
+    AudioFile.status,
+    AudioFile.source_type,
+    AudioFile.created_at,
+    AudioFile.updated_at,
+)
+
 
 class AudioFileRepository:
     def __init__(self, session: AsyncSession) -> None:
@@ -24,8 +43,16 @@ class AudioFileRepository:
     # ── Reads ─────────────────────────────────────────────────────────────────
 
     async def get_by_id(self, audio_file_id: uuid.UUID) -> Optional[AudioFile]:
+        return await self._session.get(AudioFile, audio_file_id)
+
+    async def get_with_features(
+        self, audio_file_id: uuid.UUID
+    ) -> Optional[AudioFile]:
+        """get_by_id with audio_features eagerly loaded."""
         result = await self._session.execute(
-            select(AudioFile).where(AudioFile.id == audio_file_id)
+            select(AudioFile)
+            .options(selectinload(AudioFile.audio_features))
+            .where(AudioFile.id == audio_file_id)
         )
         return result.scalar_one_or_none()
 
@@ -56,7 +83,11 @@ class AudioFileRepository:
         status: Optional[AudioFileStatus] = None,
         page: int = 1,
         page_size: int = 20,
-    ) -> tuple[list[AudioFile], int]:
+    ) -> tuple[list[Row], int]:
+        """
+        Read-only listing: returns plain column rows (attribute access, no ORM
+        instances, identity map or polymorphic loading) plus the total count.
+        """
         offset = (page - 1) * page_size
 
         filters = [AudioFile.project_id == project_id]
@@ -71,13 +102,13 @@ class AudioFileRepository:
         total: int = total_result.scalar_one()
 
         items_result = await self._session.execute(
-            select(AudioFile)
+            select(*LIST_COLUMNS)
             .where(*filters)
             .order_by(AudioFile.created_at.desc())
             .offset(offset)
             .limit(page_size)
         )
-        return list(items_result.scalars().all()), total
+        return list(items_result.all()), total
 
     # ── Writes ────────────────────────────────────────────────────────────────
 
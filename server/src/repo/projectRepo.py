@@ -8,12 +8,12 @@ from typing import Optional
 
 from sqlalchemy import exists, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import noload, selectinload
+from sqlalchemy.orm import joinedload, noload, selectinload
 
 from src.database.models.project import Project
 
 PROJECT_POPULATE = [
-    selectinload(Project.main_audio),
+    joinedload(Project.main_audio),
     selectinload(Project.separated_audios),
     selectinload(Project.emotion_analysis_record),
     selectinload(Project.instrument_analysis_record),
@@ -92,8 +92,7 @@ class ProjectRepository:
         )
         self._session.add(project)
         await self._session.flush()  # populate PK/timestamps without committing
-        await self._session.refresh(project)
-        return project
+        return await self._reload(project)
 
     async def update(
         self,
@@ -106,8 +105,20 @@ class ProjectRepository:
         if description is not None:
             project.description = description
         await self._session.flush()
-        await self._session.refresh(project)
-        return project
+        return await self._reload(project)
+
+    async def _reload(self, project: Project) -> Project:
+        """
+        refresh() with PROJECT_POPULATE: the relationships are raise_on_sql by
+        default and refresh() takes no loader options, so re-select instead.
+        """
+        result = await self._session.execute(
+            select(Project)
+            .where(Project.id == project.id)
+            .options(*PROJECT_POPULATE)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one()
 
     async def set_main_audio(
         self,
@@ -1,4 +1,6 @@
+from src.core.settings import CONSTANTS
 from src.routes import (
+    analysis,
     audio_features,
     audio_file,
     auth,
@@ -6,15 +8,33 @@ from src.routes import (
     separate_audio,
     system,
     user,
-    analysis
 )
+from src.routes.websocket import ws_router
+
+# (router, prefix, tags, include_in_schema)
+_ROUTES = (
+    (system.router, "/api", ["System"], True),
+    (auth.router, "/api/auth", ["Authentication"], True),
+    (user.router, "/api/user", ["User"], True),
+    (separate_audio.router, "", ["AudioSeparate"], True),  # ← no prefix
+    (audio_features.router, "/api/audio/audio-feature", ["Audio Feature"], True),
+    (project.router, "/api/projects", ["Projects"], True),
+    (audio_file.router, "/api/projects/{project_id}/audio-files", ["Audio Files"], True),
+    (analysis.router, "/api/analysis", ["Analysis"], True),
+    # websocket routes never appear in OpenAPI; skip the schema merge
+    (ws_router.router, "", None, False),
+)
+
 
 def register_routes(app):
-    app.include_router(system.router, prefix="/api", tags=["System"])
-    app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
-    app.include_router(user.router, prefix="/api/user", tags=["User"])
-    app.include_router(separate_audio.router, tags=["AudioSeparate"])  # ← remove prefix
-    app.include_router(audio_features.router, prefix="/api/audio/audio-feature", tags=["Audio Feature"])
-    app.include_router(project.router, prefix="/api/projects", tags=["Projects"])
-    app.include_router(audio_file.router, prefix="/api/projects/{project_id}/audio-files", tags=["Audio Files"])
-    app.include_router(analysis.router, prefix="/api/analysis", tags=["Analysis"])
\ No newline at end of file
+    routes = _ROUTES
+    if CONSTANTS.ENV == "dev":
+        # imported here so prod never loads the debug module
+        from src.routes import debug
+
+        routes += ((debug.router, "", None, False),)
+
+    for router, prefix, tags, include_in_schema in routes:
+        app.include_router(
+            router, prefix=prefix, tags=tags, include_in_schema=include_in_schema
+        )
@@ -11,6 +11,7 @@ from tempfile import NamedTemporaryFile
 from fastapi import APIRouter, File, HTTPException, Query, UploadFile
 from fastapi.responses import JSONResponse
 
+from ..core.settings import CONSTANTS
 from ..models.model_service import ModelService
 
 logger = logging.getLogger(__name__)
@@ -64,7 +65,7 @@ async def debug_predict_audio(
         default="both", description="Prediction type: 'static', 'dynamic', or 'both'"
     ),
 ):
-    ModelService.initialize_emotion_pipeline()
+    await ModelService.ensure_emotion_pipeline()
 
     temp_path = NamedTemporaryFile(delete=False, suffix=".wav")
     with open(temp_path.name, "wb") as buffer:
@@ -86,10 +87,9 @@ async def predict_instrument(
     temp_path = None
 
     try:
-        allowed_ext = {".mp3", ".wav", ".ogg", ".flac", ".m4a"}
         file_ext = os.path.splitext(file.filename)[1].lower()
 
-        if file_ext not in allowed_ext:
+        if file_ext not in CONSTANTS.ALLOWED_AUDIO_EXT_SET:
             raise HTTPException(
                 status_code=400, detail=f"Unsupported file format: {file_ext}"
             )
@@ -205,10 +205,9 @@ async def predict_all(
 
     try:
         # Validate file
-        allowed_ext = {".mp3", ".wav", ".ogg", ".flac", ".m4a"}
         file_ext = os.path.splitext(file.filename)[1].lower()
 
-        if file_ext not in allowed_ext:
+        if file_ext not in CONSTANTS.ALLOWED_AUDIO_EXT_SET:
             raise HTTPException(
                 status_code=400, detail=f"Unsupported format: {file_ext}"
             )
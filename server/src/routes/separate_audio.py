@@ -353,7 +353,11 @@ async def delete_audio(
     try:
         audio_uuid = uuid.UUID(audio_id)
 
-        result = await db.execute(select(AudioFile).where(AudioFile.id == audio_uuid))
+        result = await db.execute(
+            select(AudioFile)
+            .options(selectinload(AudioFile.separated_sources))
+            .where(AudioFile.id == audio_uuid)
+        )
         audio = result.scalar_one_or_none()
 
         if not audio:
@@ -363,11 +367,11 @@ async def delete_audio(
                 http_status=404,
             )
 
-        for stem in audio.separated_sources:
-            try:
-                await storage.delete_file("audio_stem", stem.file_path)
-            except Exception:
-                logger.warning(f"Failed to delete stem: {stem.file_path}")
+        stem_paths = [stem.file_path for stem in audio.separated_sources]
+        try:
+            await storage.delete_files("audio_stem", stem_paths)
+        except Exception:
+            logger.warning(f"Failed to delete stems: {stem_paths}")
 
         await storage.delete_file(
             CONSTANTS.SUPABASE_AUDIO_SOURCE_BUCKET,
@@ -398,10 +402,7 @@ async def download_stem(
     try:
         stem_uuid = uuid.UUID(stem_id)
 
-        result = await db.execute(
-            select(SeparatedAudioFile).where(SeparatedAudioFile.id == stem_uuid)
-        )
-        stem = result.scalar_one_or_none()
+        stem = await db.get(SeparatedAudioFile, stem_uuid)
 
         if not stem:
             return ApiErrorResponse(
@@ -1,62 +1,120 @@
 import asyncio
+import logging
 from datetime import UTC, datetime
 
+from cachetools import TTLCache
 from fastapi import APIRouter
 
 from src.core.lazy_loads import get_supabase
 from src.core.settings import CONSTANTS
-from src.database.session import test_db_connection
-from src.models.model_service import ModelService
-from src.schemas.api.response import ApiResponse
+from src.database.session import get_health_engine, test_db_connection
+from src.middlewares.health import set_health_body
+from src.schemas.api.response import ApiResponse, ORJSONResponse
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# (message, data) of the last health probe, keyed by the empty tuple
+_health_cache: TTLCache = TTLCache(maxsize=1, ttl=CONSTANTS.HEALTH_CACHE_TTL)
+_health_lock = asyncio.Lock()
+_last_health: tuple[str, dict] | None = None
+_db_ping_semaphore = asyncio.Semaphore(1)
 
-@router.get("/api/")
+# Everything but the timestamp is fixed for the lifetime of the process
+_ROOT_DATA = {
+    "app_name": CONSTANTS.APP_NAME,
+    "version": CONSTANTS.APP_VERSION,
+    "environment": CONSTANTS.ENV,
+    "debug": CONSTANTS.DEBUG,
+    "status": "active",
+    "endpoints": {
+        "websocket_emotion": "/ws/analyze-emotion",
+        "websocket_instrument": "/ws/analyze-instrument",
+        "rest_docs": "/docs",
+        "rest_health": "/health",
+    },
+}
+_ROOT_MESSAGE = f"Welcome to {CONSTANTS.APP_NAME} 🎵"
+
+
+# Both handlers return a ready-built ORJSONResponse (no response_model), so
+# FastAPI skips response validation and re-serialization entirely.
+@router.get("/api/", response_class=ORJSONResponse)
 async def root():
-    data = {
-        "app_name": CONSTANTS.APP_NAME,
-        "version": CONSTANTS.APP_VERSION,
-        "environment": CONSTANTS.ENV,
-        "debug": CONSTANTS.DEBUG,
-        "status": "active",
-        "timestamp": datetime.now(UTC).isoformat() + "Z",
-        "endpoints": {
-            "websocket_emotion": "/ws/analyze-emotion",
-            "websocket_instrument": "/ws/analyze-instrument",
-            "rest_docs": "/docs",
-            "rest_health": "/health",
-        },
-    }
     return ApiResponse(
-        message=f"Welcome to {CONSTANTS.APP_NAME} 🎵",
-        data=data,
+        message=_ROOT_MESSAGE,
+        data={**_ROOT_DATA, "timestamp": datetime.now(UTC)},
     )
 
 
-@router.get("/api/health")
-async def health_check():
-    supabase = get_supabase()
-    db_health, health = await asyncio.gather(
-        test_db_connection(),
+async def _probe_supabase() -> bool:
+    return await get_supabase() is not None
+
+
+async def _probe_db() -> dict:
+    async with _db_ping_semaphore:
+        return await test_db_connection(get_health_engine())
+
+
+async def _probe_health() -> tuple[str, dict]:
+    global _last_health
+
+    from src.models.model_service import ModelService
+
+    supabase, db_health, health = await asyncio.gather(
+        _probe_supabase(),
+        _probe_db(),
         ModelService.health_check(),
+        return_exceptions=True,
     )
 
+    if isinstance(health, BaseException):
+        if _last_health is None:
+            raise health
+        message, data = _last_health
+        return message, {**data, "status": "stale"}
+    if isinstance(supabase, BaseException):
+        logger.warning(f"Supabase health probe failed: {supabase}")
+        supabase = False
+    if isinstance(db_health, BaseException):
+        logger.warning(f"Database health probe failed: {db_health}")
+        db_health = {"ok": False, "latency_ms": None}
+
     all_healthy: bool = (
         db_health["ok"]
         and health["emotion_detection"]["status"] == "healthy"
         and health["instrument_detection"]["available"]
     )
-    return ApiResponse(
-        message=("All models loaded" if all_healthy else "Some models unavailable"),
-        data={
-            "status": "healthy" if supabase else "degraded",
-            "emotion_detection": health["emotion_detection"],
-            "instrument_detection": health["instrument_detection"],
-            "database": "connected" if db_health["ok"] else "disconnected",
-            "db_latency_ms": db_health["latency_ms"],
-            "supabase": "connected" if supabase else "disconnected",
-            "timestamp": datetime.now(UTC).isoformat() + "Z",
-            "models": health,
-        },
-    )
+    message = "All models loaded" if all_healthy else "Some models unavailable"
+    data = {
+        "status": "healthy" if supabase else "degraded",
+        "emotion_detection": health["emotion_detection"],
+        "instrument_detection": health["instrument_detection"],
+        "database": "connected" if db_health["ok"] else "disconnected",
+        "db_latency_ms": db_health["latency_ms"],
+        "supabase": "connected" if supabase else "disconnected",
+        "timestamp": datetime.now(UTC),
+        "models": health,
+    }
+    _last_health = (message, data)
+    return message, data
+
+
+async def _get_health() -> tuple[str, dict]:
+    cached = _health_cache.get(())
+    if cached is None:
+        async with _health_lock:
+            cached = _health_cache.get(())
+            if cached is None:
+                cached = _health_cache[()] = await _probe_health()
+
+    return cached
+
+
+@router.get("/api/health", response_class=ORJSONResponse)
+async def health_check():
+    message, data = await _get_health()
+    response = ApiResponse(message=message, data=data)
+    # Hand the body to the fast-path middleware until the next probe is due
+    set_health_body(response.body, CONSTANTS.HEALTH_CACHE_TTL)
+    return response
@@ -1,8 +1,9 @@
 import uuid
 from datetime import datetime
-from typing import Any, Optional
+from typing import Annotated, Any, Optional
 
-from pydantic import BaseModel, ConfigDict
+import numpy as np
+from pydantic import BaseModel, ConfigDict, PlainSerializer, WithJsonSchema
 
 
 # =====================================================
@@ -56,7 +57,13 @@ class EmotionAnalysisRecordResponse(BaseModel):
 
     results: dict[str, Any] | None = None
     prediction_result: dict[str, Any] | None = None
-    vgg_embeddings: dict[str, Any] | list[Any] | None = None
+    vgg_embeddings: Annotated[
+        np.ndarray,
+        PlainSerializer(np.ndarray.tolist, when_used="json"),
+        WithJsonSchema(
+            {"type": "array", "items": {"type": "array", "items": {"type": "number"}}}
+        ),
+    ] | None = None
 
 
 class EmotionAnalysisApiResponse(ApiResponse):
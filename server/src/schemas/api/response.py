@@ -1,6 +1,7 @@
 from datetime import UTC, datetime
 from typing import Any, Optional, TypedDict
 
+import orjson
 from fastapi import status
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
@@ -9,6 +10,22 @@ from pydantic import BaseModel
 from src.core.settings import CONSTANTS
 from src.schemas.api.error import ApiError
 
+_REFRESH_COOKIE_MAX_AGE = CONSTANTS.REFRESH_TOKEN_EXPIRE_SECONDS
+_REFRESH_COOKIE_SECURE = CONSTANTS.ENV == "prod"
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson.
+    Datetimes are emitted natively as RFC 3339 (UTC as `Z`); anything orjson
+    can't handle (pydantic models, Decimal, ...) falls back to jsonable_encoder.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=jsonable_encoder, option=ORJSON_OPTIONS)
+
 
 class ApiEnvelope(BaseModel):
     success: bool
@@ -38,7 +55,7 @@ def _base_payload(
         "data": data or {},
         "error": error.model_dump() if error else None,
         "meta": meta or {},
-        "timestamp": datetime.now(UTC).isoformat(),
+        "timestamp": datetime.now(UTC),
     }
 
 
@@ -50,7 +67,7 @@ def ApiResponse(
     error: ApiError | None = None,
     meta: dict | None = None,
     status_code: int = 200,
-) -> JSONResponse:
+) -> ORJSONResponse:
     payload = _base_payload(
         success=(200 <= status_code < 300),
         message=message,
@@ -59,10 +76,8 @@ def ApiResponse(
         meta=meta,
     )
 
-    safe_payload = jsonable_encoder(payload)
-
-    return JSONResponse(
-        content=safe_payload, status_code=status_code, headers=custom_headers
+    return ORJSONResponse(
+        content=payload, status_code=status_code, headers=custom_headers
     )
 
 
@@ -74,7 +89,7 @@ def ApiAuthResponse(
     *,
     meta: dict | None = None,
     status_code: int = 200,
-) -> JSONResponse:
+) -> ORJSONResponse:
     data = data if data else {}
     custom_headers = {}
 
@@ -89,10 +104,8 @@ def ApiAuthResponse(
     if access_token:
         custom_headers["Authorization"] = f"Bearer {access_token}"
 
-    safe_payload = jsonable_encoder(payload)
-
-    response = JSONResponse(
-        content=safe_payload,
+    response = ORJSONResponse(
+        content=payload,
         status_code=status_code,
         headers=custom_headers,
     )
@@ -102,8 +115,8 @@ def ApiAuthResponse(
             key="refresh_token",
             value=refresh_token,
             httponly=True,
-            max_age=CONSTANTS.REFRESH_TOKEN_EXPIRE_SECONDS,
-            secure=CONSTANTS.ENV == "prod",
+            max_age=_REFRESH_COOKIE_MAX_AGE,
+            secure=_REFRESH_COOKIE_SECURE,
         )
 
     return response
@@ -115,12 +128,13 @@ def ApiErrorResponse(
     message: str,
     details: Optional[Any] = None,
     http_status: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
-) -> JSONResponse:
-    api_error = ApiError(code=code, message=message, details=details)
-    return ApiResponse(
+) -> ORJSONResponse:
+    payload = _base_payload(
+        success=(200 <= http_status < 300),
         message=message,
-        data=None,
-        error=api_error,
-        meta=None,
-        status_code=http_status,
     )
+    # Same shape as ApiError.model_dump(), built directly: every 4xx/5xx
+    # goes through here and none of it needs validating
+    payload["error"] = {"code": code, "message": message, "details": details}
+
+    return ORJSONResponse(content=payload, status_code=http_status)
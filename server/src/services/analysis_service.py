@@ -2,6 +2,7 @@ import json
 import logging
 import uuid
 
+import numpy as np
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
@@ -53,7 +54,7 @@ class AnalysisService:
         project_id: uuid.UUID,
         audio_file_id: uuid.UUID,    
         prediction_result: dict,
-        embeddings: dict | list | None = None,
+        embeddings: np.ndarray | list | None = None,
         model_id: uuid.UUID | None = None,
     ):
 
@@ -38,7 +38,7 @@ class AudioFeatureService:
 
     async def extract_and_store(self, audio_file_id):
 
-        audio = await self._audio_repo.get_by_id(audio_file_id)
+        audio = await self._audio_repo.get_with_features(audio_file_id)
 
         if not audio:
             raise HTTPException(
@@ -269,7 +269,7 @@ class AudioFeatureService:
 
     async def get_all_features(self, audio_file_id):
 
-        audio = await self._audio_repo.get_by_id(audio_file_id)
+        audio = await self._audio_repo.get_with_features(audio_file_id)
 
         if not audio:
             raise HTTPException(
@@ -13,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.core.settings import CONSTANTS
 from src.core.supabase import SupabaseStorageClient
 from src.database.enums import AudioFileStatus, AudioFormat, AudioSourceType
+from src.database.mixins import uuid7
 from src.repo.audioFileRepo import AudioFileRepository
 from src.repo.projectRepo import ProjectRepository
 from src.schemas.audioFile import (
@@ -152,7 +153,7 @@ class AudioFileService:
             await self._session.commit()
             return AudioFileUploadResponse.model_validate(existing)
 
-        file_id = uuid.uuid4()
+        file_id = uuid7()
         storage_path = _build_storage_path(
             project_id, file_id, file.filename or f"{file_id}.bin"
         )
@@ -2,10 +2,10 @@
 # security and authentication service
 import logging
 import secrets
+import uuid
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Literal, Optional
-from uuid import uuid4
 
 import jwt
 from argon2 import PasswordHasher
@@ -15,16 +15,24 @@ from sqlalchemy import and_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.settings import CONSTANTS
+from src.database.mixins import uuid7
 from src.database.models import RefreshToken
 from src.database.models.user import User
 from src.schemas.token import (
     Access_Token_Payload,
     Refresh_Token_Payload,
 )
-from src.utils.db_util import db_query
+from src.utils.db_util import db_get, db_query
 
 logger = logging.getLogger(__name__)
 
+# Resolved once; decode_token() runs on every authenticated request
+_TOKEN_SECRETS: dict[str, str] = {
+    "access": CONSTANTS.JWT_ACCESS_TOKEN_SECRET.get_secret_value(),
+    "refresh": CONSTANTS.JWT_REFRESH_TOKEN_SECRET.get_secret_value(),
+}
+_JWT_ALGORITHMS: list[str] = [CONSTANTS.JWT_ALGORITHM]
+
 
 ph = PasswordHasher(
     time_cost=3,  # number of iterations
@@ -55,10 +63,6 @@ def FIND_USER_BY_EMAIL_QUERY(email: str):
     return select(User).where(User.email == email)
 
 
-def FIND_USER_BY_ID_QUERY(user_id: str):
-    return select(User).where(User.id == user_id)
-
-
 def FIND_REFRESH_TOKEN_QUERY(refresh_token: str):
     return select(RefreshToken).where(RefreshToken.token == refresh_token)
 
@@ -127,7 +131,7 @@ class AuthService:
 
         encoded = jwt.encode(
             dict(payload),
-            CONSTANTS.JWT_ACCESS_TOKEN_SECRET.get_secret_value(),
+            _TOKEN_SECRETS["access"],
             algorithm=CONSTANTS.JWT_ALGORITHM,
         )
 
@@ -150,7 +154,7 @@ class AuthService:
 
         encoded = jwt.encode(
             dict(payload),
-            CONSTANTS.JWT_REFRESH_TOKEN_SECRET.get_secret_value(),
+            _TOKEN_SECRETS["refresh"],
             algorithm=CONSTANTS.JWT_ALGORITHM,
         )
 
@@ -218,14 +222,10 @@ class AuthService:
         @throws JWTError, ExpiredSignatureError, TypeError
         """
         try:
-            secret = (
-                CONSTANTS.JWT_ACCESS_TOKEN_SECRET.get_secret_value()
-                if type == "access"
-                else CONSTANTS.JWT_REFRESH_TOKEN_SECRET.get_secret_value()
+            decoded = jwt.decode(
+                token, _TOKEN_SECRETS[type], algorithms=_JWT_ALGORITHMS
             )
 
-            decoded = jwt.decode(token, secret, algorithms=[CONSTANTS.JWT_ALGORITHM])
-
             if decoded.get("type") != type:
                 raise TypeError(
                     f"Required token of type '{type}', received '{decoded.get('type')}'."
@@ -261,7 +261,7 @@ class AuthService:
             return None
 
         user = User(
-            id=uuid4(),
+            id=uuid7(),
             name=name,
             username=username,
             email=email,
@@ -282,9 +282,14 @@ class AuthService:
 
     @staticmethod
     async def get_user_by_id(db: AsyncSession, user_id: str) -> Optional[User]:
-        query = FIND_USER_BY_ID_QUERY(user_id)
-        result = await db_query(db, query, f"Error fetching user by id: {user_id}.")
-        return result.scalar_one_or_none()
+        try:
+            # Session.get() keys the identity map on the UUID, not its string
+            user_uuid = uuid.UUID(str(user_id))
+        except ValueError:
+            return None
+        return await db_get(
+            db, User, user_uuid, f"Error fetching user by id: {user_id}."
+        )
 
     @staticmethod
     async def authenticate_user(
@@ -327,9 +332,7 @@ class AuthService:
 
     @staticmethod
     async def set_email_as_verified(db: AsyncSession, user_id: str) -> bool:
-        query = FIND_USER_BY_ID_QUERY(user_id)
-        result = await db_query(db, query, f"Error fetching user by id: {user_id}.")
-        user: User = result.scalar_one_or_none()
+        user = await AuthService.get_user_by_id(db, user_id)
         if not user:
             return False
 
@@ -339,9 +342,7 @@ class AuthService:
 
     @staticmethod
     async def set_password(db: AsyncSession, user_id: str, new_password: str) -> bool:
-        query = FIND_USER_BY_ID_QUERY(user_id)
-        result = await db_query(db, query, f"Error fetching user by id: {user_id}.")
-        user: User = result.scalar_one_or_none()
+        user = await AuthService.get_user_by_id(db, user_id)
         if not user:
             return False
 
@@ -56,8 +56,7 @@ async def update_stem_status(
         audio_uuid = uuid.UUID(audio_id) if isinstance(audio_id, str) else audio_id
 
         # 1. Fetch AudioFile
-        result = await db.execute(select(AudioFile).where(AudioFile.id == audio_uuid))
-        audio = result.scalar_one_or_none()
+        audio = await db.get(AudioFile, audio_uuid)
         if not audio:
             logger.error(f"AudioFile {audio_id} not found — cannot update stem status")
             return
@@ -5,8 +5,8 @@ import logging
 import uuid
 from pathlib import Path
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import NullPool
 from supabase import acreate_client
 
 from src.core.settings import CONSTANTS
@@ -25,11 +25,12 @@ def get_session_factory():
     global _engine, _session_factory
 
     if _session_factory is None:
+        # Each task runs on a fresh event loop and disposes the engine when
+        # done, so pooled connections could never be reused anyway (asyncpg
+        # connections are bound to their loop); open one per checkout instead
         _engine = create_async_engine(
             CONSTANTS.ASYNC_POOLER_DATABASE_URL,
-            pool_size=5,
-            max_overflow=10,
-            pool_pre_ping=True,
+            poolclass=NullPool,
             echo=False,
         )
         _session_factory = async_sessionmaker(
@@ -77,10 +78,7 @@ async def _run_separation(audio_id: str, project_id: str):
                 await update_stem_status(db, audio_id, "processing")
 
                 # Fetch audio record
-                result = await db.execute(
-                    select(AudioFile).where(AudioFile.id == uuid.UUID(audio_id))
-                )
-                audio = result.scalar_one_or_none()
+                audio = await db.get(AudioFile, uuid.UUID(audio_id))
                 if not audio:
                     raise ValueError(f"AudioFile {audio_id} not found")
 
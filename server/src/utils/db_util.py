@@ -1,4 +1,5 @@
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import HTTPException, status
 from sqlalchemy import text
@@ -8,14 +9,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 logger = logging.getLogger(__name__)
 
 
-async def db_query(
-    db: AsyncSession,
-    query,
-    fail_message: str = "Database operation failed.",
-):
+@asynccontextmanager
+async def _db_errors(db: AsyncSession, fail_message: str):
+    """Roll back and surface any DB failure as a 500 HTTPException."""
     try:
-        result = await db.execute(query)
-        return result
+        yield
     except SQLAlchemyError as e:
         await db.rollback()
         logger.exception(f"{fail_message}: {e}")
@@ -32,6 +30,29 @@ async def db_query(
         )
 
 
+async def db_query(
+    db: AsyncSession,
+    query,
+    fail_message: str = "Database operation failed.",
+):
+    async with _db_errors(db, fail_message):
+        return await db.execute(query)
+
+
+async def db_get(
+    db: AsyncSession,
+    model,
+    ident,
+    fail_message: str = "Database operation failed.",
+):
+    """
+    Primary-key lookup through Session.get(), which answers from the identity
+    map without a round trip when the row is already loaded in this session.
+    """
+    async with _db_errors(db, fail_message):
+        return await db.get(model, ident)
+
+
 async def test_db_connection() -> bool:
     """
     Test connection to the async database.